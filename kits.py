@@ -1,14 +1,22 @@
-KITS_DATABASE = {
-    # Format: "id": ["Team", "Season", "Type", "Main Color", "Secondary Color", "Manufacturer", "Sponsor"]
-    "1": ["Manchester United", "2023-24", "Home", "Red", "White", "Adidas", "TeamViewer"],
-    "2": ["Manchester United", "2023-24", "Away", "White", "Red", "Adidas", "TeamViewer"],
-    "3": ["Manchester United", "2023-24", "Third", "Green", "Black", "Adidas", "TeamViewer"],
-    "4": ["Real Madrid", "2023-24", "Home", "White", "Gold", "Adidas", "Emirates"],
-    "5": ["Real Madrid", "2023-24", "Away", "Purple", "Black", "Adidas", "Emirates"],
-    "6": ["Barcelona", "2023-24", "Home", "Blue/Red", "Gold", "Nike", "Spotify"],
-    "7": ["Barcelona", "2023-24", "Away", "White", "Red/Blue", "Nike", "Spotify"],
-    "8": ["Manchester City", "2023-24", "Home", "Sky Blue", "White", "Puma", "Etihad Airways"],
-    "9": ["Liverpool", "2023-24", "Home", "Red", "White", "Nike", "Standard Chartered"],
-    "10": ["PSG", "2023-24", "Home", "Navy", "Red", "Nike", "Qatar Airways"],
-    # Add more kits...
-} 
\ No newline at end of file
+from .snapshot import load_snapshot
+
+
+def build_database():
+    """Build the default kits database"""
+    return {
+        # Format: id: ["Team", "Season", "Type", "Main Color", "Secondary Color", "Manufacturer", "Sponsor"]
+        1: ["Manchester United", "2023-24", "Home", "Red", "White", "Adidas", "TeamViewer"],
+        2: ["Manchester United", "2023-24", "Away", "White", "Red", "Adidas", "TeamViewer"],
+        3: ["Manchester United", "2023-24", "Third", "Green", "Black", "Adidas", "TeamViewer"],
+        4: ["Real Madrid", "2023-24", "Home", "White", "Gold", "Adidas", "Emirates"],
+        5: ["Real Madrid", "2023-24", "Away", "Purple", "Black", "Adidas", "Emirates"],
+        6: ["Barcelona", "2023-24", "Home", "Blue/Red", "Gold", "Nike", "Spotify"],
+        7: ["Barcelona", "2023-24", "Away", "White", "Red/Blue", "Nike", "Spotify"],
+        8: ["Manchester City", "2023-24", "Home", "Sky Blue", "White", "Puma", "Etihad Airways"],
+        9: ["Liverpool", "2023-24", "Home", "Red", "White", "Nike", "Standard Chartered"],
+        10: ["PSG", "2023-24", "Home", "Navy", "Red", "Nike", "Qatar Airways"],
+        # Add more kits...
+    }
+
+
+KITS_DATABASE = load_snapshot(__file__, build_database)
@@ -1,16 +1,24 @@
-LEAGUES_DATABASE = {
-    # Format: "id": ["Name", "Country", "Division", "Teams Count", "Logo Code"]
-    "13": ["Premier League", "England", "1", "20", "PL"],
-    "53": ["LaLiga EA Sports", "Spain", "1", "20", "LALIGA"],
-    "16": ["Ligue 1 Uber Eats", "France", "1", "20", "L1"],
-    "19": ["Bundesliga", "Germany", "1", "18", "BL1"],
-    "31": ["Serie A", "Italy", "1", "20", "SERIEA"],
-    "308": ["Primeira Liga", "Portugal", "1", "18", "LIGA"],
-    "10": ["Eredivisie", "Netherlands", "1", "18", "ERE"],
-    "4": ["Belgian Pro League", "Belgium", "1", "16", "JPL"],
-    "83": ["Liga Profesional", "Argentina", "1", "28", "LPF"],
-    "7": ["Brasileirão", "Brazil", "1", "20", "BRSL"],
-    "39": ["MLS", "United States", "1", "29", "MLS"],
-    "41": ["Saudi Pro League", "Saudi Arabia", "1", "18", "SPL"],
-    # Add more leagues...
-} 
\ No newline at end of file
+from .snapshot import load_snapshot
+
+
+def build_database():
+    """Build the default leagues database"""
+    return {
+        # Format: id: ["Name", "Country", "Division", "Teams Count", "Logo Code"]
+        13: ["Premier League", "England", "1", "20", "PL"],
+        53: ["LaLiga EA Sports", "Spain", "1", "20", "LALIGA"],
+        16: ["Ligue 1 Uber Eats", "France", "1", "20", "L1"],
+        19: ["Bundesliga", "Germany", "1", "18", "BL1"],
+        31: ["Serie A", "Italy", "1", "20", "SERIEA"],
+        308: ["Primeira Liga", "Portugal", "1", "18", "LIGA"],
+        10: ["Eredivisie", "Netherlands", "1", "18", "ERE"],
+        4: ["Belgian Pro League", "Belgium", "1", "16", "JPL"],
+        83: ["Liga Profesional", "Argentina", "1", "28", "LPF"],
+        7: ["Brasileirão", "Brazil", "1", "20", "BRSL"],
+        39: ["MLS", "United States", "1", "29", "MLS"],
+        41: ["Saudi Pro League", "Saudi Arabia", "1", "18", "SPL"],
+        # Add more leagues...
+    }
+
+
+LEAGUES_DATABASE = load_snapshot(__file__, build_database)
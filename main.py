@@ -2,6 +2,10 @@
 
 import sys
 import os
+import logging
+from collections import ChainMap
+from functools import lru_cache, partial
+from string import Template
 
 # Add the current directory to Python path
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -11,86 +15,294 @@ if current_dir not in sys.path:
 try:
     from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                                 QHBoxLayout, QPushButton, QLabel, QFileDialog, 
-                                QTableWidget, QTableWidgetItem, QMessageBox,
+                                QTableView, QAbstractItemView, QMessageBox,
                                 QTabWidget, QComboBox, QSpinBox, QLineEdit,
-                                QGroupBox, QFormLayout, QHeaderView, QScrollArea)
-    from PyQt6.QtCore import Qt
+                                QGroupBox, QFormLayout, QHeaderView, QScrollArea,
+                                QProgressDialog)
+    from PyQt6.QtCore import (Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel,
+                              QTimer, QObject, QRunnable, QThreadPool, pyqtSignal)
     from PyQt6.QtGui import QFont, QAction
 except ImportError:
     print("Error: PyQt6 is not installed. Please install it using:")
     print("pip install PyQt6")
     sys.exit(1)
 
-# Import squad file parser
+# Import squad file parser and the default databases
 try:
     from database.squad_parser import SquadFile
+    from database.countries import COUNTRIES_DATABASE
+    from database.leagues import LEAGUES_DATABASE
+    from database.teams import TEAMS_DATABASE
+    from database import players as default_players
+    from database.stadiums import STADIUMS_DATABASE
+    from database.tournaments import TOURNAMENTS_DATABASE
+    from database.kits import KITS_DATABASE
 except ImportError as e:
     print(f"Error importing squad parser: {e}")
     print("Make sure you're running the script from the correct directory")
     sys.exit(1)
 
+logger = logging.getLogger(__name__)
+
+# Application stylesheet template, filled with a theme's colors and applied once to the QApplication
+STYLESHEET_PATH = os.path.join(current_dir, "resources", "app.qss")
+
+THEMES = {
+    "dark": {
+        "background": "#2b2b2b", "text": "#ffffff", "border": "#555555", "base": "#333333",
+        "tab": "#353535", "tab_selected": "#454545",
+        "raised": "#404040", "button_hover": "#4a4a4a", "button_pressed": "#303030"
+    },
+    "light": {
+        "background": "#f0f0f0", "text": "#000000", "border": "#b0b0b0", "base": "#ffffff",
+        "tab": "#e0e0e0", "tab_selected": "#ffffff",
+        "raised": "#e6e6e6", "button_hover": "#d8d8d8", "button_pressed": "#c8c8c8"
+    }
+}
+
+
+@lru_cache(maxsize=1)
+def load_stylesheet(path=STYLESHEET_PATH):
+    """Read a Qt stylesheet file, the text is kept for later windows"""
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def minify_stylesheet(text):
+    """Drop the indentation and line breaks of a stylesheet, Qt does not need them"""
+    return "".join(line.strip() for line in text.splitlines())
+
+
+@lru_cache(maxsize=len(THEMES))
+def stylesheet_for(theme):
+    """Fill the stylesheet template with the colors of a theme, once per theme"""
+    return minify_stylesheet(Template(load_stylesheet()).substitute(THEMES[theme]))
+
+
+class SquadTableModel(QAbstractTableModel):
+    """Read-only table model over one of the squad file's id -> row dicts.
+
+    Column 0 shows the record ID, the remaining columns show the row fields
+    listed in ``columns``. Cells are only stringified when Qt paints them.
+    """
+
+    def __init__(self, headers, columns, rows=None, parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        self._columns = columns
+        self._rows = {}
+        self._ids = []
+        self._search_text = None
+        if rows is not None:
+            self.set_rows(rows)
+
+    def set_rows(self, rows):
+        """Point the model at a new id -> row dict"""
+        self.beginResetModel()
+        self._rows = rows
+        self._ids = list(rows.keys())
+        self._search_text = None
+        self.endResetModel()
+
+    def row_id(self, row):
+        """Get the record ID shown in the given row"""
+        return self._ids[row]
+
+    def text(self, row, column):
+        """Get the display text of a cell"""
+        row_id = self._ids[row]
+        if column == 0:
+            return str(row_id)
+        row_data = self._rows[row_id]
+        field = self._columns[column - 1]
+        # Rows parsed from squad files can have fewer fields than the tab shows
+        if field >= len(row_data):
+            return ""
+        return str(row_data[field])
+
+    def search_text(self, row):
+        """Get the lowercased text of a whole row, built for all rows on first use"""
+        if self._search_text is None:
+            self._search_text = [self.row_search_text(r) for r in range(len(self._ids))]
+        return self._search_text[row]
+
+    def row_search_text(self, row):
+        """Build the search text of a single row"""
+        return "\n".join(self.text(row, column) for column in range(len(self._headers))).lower()
+
+    def refresh_row(self, row):
+        """Repaint a row after its underlying data changed"""
+        if self._search_text is not None:
+            self._search_text[row] = self.row_search_text(row)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self._headers) - 1))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._ids)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        return self.text(index.row(), index.column())
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return None
+
+
+class SquadFilterProxyModel(QSortFilterProxyModel):
+    """Hides rows that don't contain the search text in any column"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._search = ""
+
+    def set_search(self, text):
+        """Filter on a new search text"""
+        self._search = text.lower()
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        return not self._search or self._search in self.sourceModel().search_text(source_row)
+
+
+class LoadSquadSignals(QObject):
+    """Signals of a LoadSquadTask"""
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str, object)
+
+
+class LoadSquadTask(QRunnable):
+    """Reads a squad file, or creates it from the default databases, off the GUI thread.
+
+    Only the squad file is touched here, all widget updates happen in the
+    slots connected to ``signals`` on the GUI thread.
+    """
+
+    def __init__(self, file_path):
+        super().__init__()
+        self.file_path = file_path
+        self.signals = LoadSquadSignals()
+
+    def run(self):
+        file_path = self.file_path
+        try:
+            file_exists = os.path.exists(file_path)
+            logger.info(f"Loading squad file from: {file_path}")
+            logger.debug(f"File exists: {file_exists}")
+            
+            squad_file = SquadFile(file_path)
+            
+            if not file_exists:
+                # If squad file doesn't exist, create it with default data
+                logger.info("Creating new squad file with default data")
+                
+                # Share the default databases instead of copying them, edits
+                # land in the empty front map so the defaults stay untouched
+                squad_file.countries = ChainMap({}, COUNTRIES_DATABASE)
+                squad_file.leagues = ChainMap({}, LEAGUES_DATABASE)
+                squad_file.teams = ChainMap({}, TEAMS_DATABASE)
+                squad_file.players = ChainMap({}, default_players.PLAYERS_DATABASE)
+                squad_file.stadiums = ChainMap({}, STADIUMS_DATABASE)
+                squad_file.tournaments = ChainMap({}, TOURNAMENTS_DATABASE)
+                squad_file.kits = ChainMap({}, KITS_DATABASE)
+                
+                squad_file.save()
+            else:
+                logger.info("Loading existing squad file")
+                squad_file.load()
+        except Exception as e:
+            self.signals.failed.emit(file_path, e)
+            return
+        
+        self.signals.finished.emit(squad_file)
+
+
 class FC25Editor(QMainWindow):
+    # Application stylesheet, built once when the class is defined
+    THEME = "dark"
+    STYLESHEET = stylesheet_for(THEME)
+    
+    # Tabs that only list their data: title -> (data attribute, headers, row field per column)
+    SIMPLE_TABS = {
+        "Leagues": ("leagues", ["ID", "Name", "Country", "Division", "Teams"], [0, 1, 2, 3]),
+        "Teams": ("teams", ["ID", "Name", "League", "OVR", "ATT", "MID", "DEF"], [0, 1, 2, 3, 4, 5]),
+        "Stadiums": ("stadiums", ["ID", "Name", "City", "Country", "Capacity", "Team", "Built"],
+                     [0, 1, 2, 3, 4, 5]),
+        "Tournaments": ("tournaments", ["ID", "Name", "Type", "Region", "Teams", "Prize", "Champion"],
+                        [0, 1, 2, 3, 4, 5]),
+        "Kits": ("kits", ["ID", "Team", "Season", "Type", "Color 1", "Color 2", "Brand", "Sponsor"],
+                 [0, 1, 2, 3, 4, 5, 6])
+    }
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("FC25 Database Editor")
         self.setGeometry(100, 100, 1600, 900)
         
-        try:
-            # Main widget and layout
-            main_widget = QWidget()
-            self.setCentralWidget(main_widget)
-            layout = QVBoxLayout(main_widget)
-            
-            # Create main tab widget
-            self.tabs = QTabWidget()
-            
-            # Add menu bar first
-            self.setup_menu_bar()
-            
-            # Initialize squad_file as None
-            self.squad_file = None
-            
-            layout.addWidget(self.tabs)
-            
-            # Set dark theme
-            self.apply_dark_theme()
-            
-            # Store current player details
-            self.current_player_details = None
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to initialize application: {str(e)}")
-            raise
+        # Main widget and layout
+        main_widget = QWidget()
+        self.setCentralWidget(main_widget)
+        layout = QVBoxLayout(main_widget)
+        
+        # Create main tab widget, tabs are built the first time they are shown
+        self.tabs = QTabWidget()
+        self.tab_setups = [
+            ("Countries", self.setup_countries_tab),
+            ("Leagues", partial(self.setup_simple_tab, "Leagues")),
+            ("Teams", partial(self.setup_simple_tab, "Teams")),
+            ("Players", self.setup_players_tab),
+            ("Stadiums", partial(self.setup_simple_tab, "Stadiums")),
+            ("Tournaments", partial(self.setup_simple_tab, "Tournaments")),
+            ("Kits", partial(self.setup_simple_tab, "Kits"))
+        ]
+        self.tab_built = [False] * len(self.tab_setups)
+        self.tabs.currentChanged.connect(self.on_tab_changed)
+        
+        # Table models of the built tabs by the data they show
+        self.models = {}
+        
+        # Add menu bar first
+        self.setup_menu_bar()
+        
+        # Initialize squad_file as None
+        self.squad_file = None
+        
+        layout.addWidget(self.tabs)
+        
+        # Store current player details
+        self.current_player_details = None
+        
+        # Edits are kept in memory until the squad file is saved
+        self.dirty = False
 
     def setup_menu_bar(self):
         """Setup the menu bar"""
-        try:
-            menubar = self.menuBar()
-            
-            # File menu
-            file_menu = menubar.addMenu('File')
-            
-            # Open action
-            open_action = QAction('Open Squad File...', self)
-            open_action.setShortcut('Ctrl+O')
-            open_action.triggered.connect(self.open_squad_file_dialog)
-            file_menu.addAction(open_action)
-            
-            # Save action
-            save_action = QAction('Save', self)
-            save_action.setShortcut('Ctrl+S')
-            save_action.triggered.connect(self.save_squad_file)
-            file_menu.addAction(save_action)
-            
-            # Exit action
-            exit_action = QAction('Exit', self)
-            exit_action.setShortcut('Ctrl+Q')
-            exit_action.triggered.connect(self.close)
-            file_menu.addAction(exit_action)
-            
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to setup menu bar: {str(e)}")
-            raise
+        menubar = self.menuBar()
+        
+        # File menu
+        file_menu = menubar.addMenu('File')
+        
+        # Open action
+        open_action = QAction('Open Squad File...', self)
+        open_action.setShortcut('Ctrl+O')
+        open_action.triggered.connect(self.open_squad_file_dialog)
+        file_menu.addAction(open_action)
+        
+        # Save action
+        save_action = QAction('Save', self)
+        save_action.setShortcut('Ctrl+S')
+        save_action.triggered.connect(self.save_squad_file)
+        file_menu.addAction(save_action)
+        
+        # Exit action
+        exit_action = QAction('Exit', self)
+        exit_action.setShortcut('Ctrl+Q')
+        exit_action.triggered.connect(self.close)
+        file_menu.addAction(exit_action)
     
     def open_squad_file_dialog(self):
         """Open squad file dialog"""
@@ -116,75 +328,167 @@ class FC25Editor(QMainWindow):
             QMessageBox.critical(self, "Error", f"Failed to open file dialog: {str(e)}")
     
     def load_squad_file(self, file_path):
-        """Load squad file"""
-        try:
-            print(f"Loading squad file from: {file_path}")
-            print(f"File exists: {os.path.exists(file_path)}")
-            print(f"File size: {os.path.getsize(file_path)} bytes")
-            
-            self.squad_file = SquadFile(file_path)
-            
-            if not os.path.exists(file_path):
-                # If squad file doesn't exist, create it with default data
-                print("Creating new squad file with default data")
-                from database.countries import COUNTRIES_DATABASE
-                from database.leagues import LEAGUES_DATABASE
-                from database.teams import TEAMS_DATABASE
-                from database.players import PLAYERS_DATABASE
-                from database.stadiums import STADIUMS_DATABASE
-                from database.tournaments import TOURNAMENTS_DATABASE
-                from database.kits import KITS_DATABASE
-                
-                self.squad_file.countries = COUNTRIES_DATABASE.copy()
-                self.squad_file.leagues = LEAGUES_DATABASE.copy()
-                self.squad_file.teams = TEAMS_DATABASE.copy()
-                self.squad_file.players = PLAYERS_DATABASE.copy()
-                self.squad_file.stadiums = STADIUMS_DATABASE.copy()
-                self.squad_file.tournaments = TOURNAMENTS_DATABASE.copy()
-                self.squad_file.kits = KITS_DATABASE.copy()
-                
-                self.squad_file.save()
-            else:
-                print("Loading existing squad file")
-                self.squad_file.load()
-            
-            # Refresh all tabs
-            self.refresh_all_tabs()
-            
-            # Update window title
-            self.setWindowTitle(f"FC25 Database Editor - {os.path.basename(file_path)}")
-            
-            QMessageBox.information(self, "Success", "Squad file loaded successfully!")
-            
-        except Exception as e:
-            error_msg = f"Failed to load squad file: {str(e)}\nFile path: {file_path}"
-            if os.path.exists(file_path):
-                error_msg += f"\nFile size: {os.path.getsize(file_path)} bytes"
-            QMessageBox.critical(self, "Error", error_msg)
-            raise
+        """Load squad file in the background"""
+        if not self.confirm_discard_changes("Save your changes to the squad file before opening another one?"):
+            return
+        
+        self.load_progress = QProgressDialog("Loading squad file...", None, 0, 0, self)
+        self.load_progress.setWindowTitle("Loading")
+        self.load_progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self.load_progress.show()
+        
+        # Keep a reference to the task until its signals were delivered
+        self.load_task = LoadSquadTask(file_path)
+        self.load_task.signals.finished.connect(self.on_squad_file_loaded)
+        self.load_task.signals.failed.connect(self.on_squad_file_load_failed)
+        QThreadPool.globalInstance().start(self.load_task)
+    
+    def on_squad_file_loaded(self, squad_file):
+        """Show a squad file that finished loading"""
+        self.close_load_progress()
+        self.squad_file = squad_file
+        
+        # Keep references to the loaded data for the tabs and detail panels
+        self.countries = self.squad_file.get_countries()
+        self.leagues = self.squad_file.get_leagues()
+        self.teams = self.squad_file.get_teams()
+        self.players = self.squad_file.get_players()
+        self.stadiums = self.squad_file.get_stadiums()
+        self.tournaments = self.squad_file.get_tournaments()
+        self.kits = self.squad_file.get_kits()
+        
+        self.dirty = False
+        
+        # Refresh all tabs
+        self.refresh_all_tabs()
+        
+        # Update window title
+        self.setWindowTitle(f"FC25 Database Editor - {os.path.basename(squad_file.file_path)}")
+        
+        self.statusBar().showMessage("Squad file loaded", 3000)
+    
+    def close_load_progress(self):
+        """Close and delete the progress dialog of a finished load"""
+        self.load_progress.close()
+        self.load_progress.deleteLater()
+        self.load_progress = None
+        self.load_task = None
+    
+    def on_squad_file_load_failed(self, file_path, error):
+        """Report a squad file that failed to load"""
+        self.close_load_progress()
+        
+        error_msg = f"Failed to load squad file: {str(error)}\nFile path: {file_path}"
+        if os.path.exists(file_path):
+            error_msg += f"\nFile size: {os.path.getsize(file_path)} bytes"
+        QMessageBox.critical(self, "Error", error_msg)
     
     def save_squad_file(self):
         """Save squad file"""
         try:
             self.squad_file.save()
-            QMessageBox.information(self, "Success", "Squad file saved successfully!")
+            self.dirty = False
+            self.statusBar().showMessage("Squad file saved", 3000)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save squad file: {str(e)}")
     
+    def confirm_discard_changes(self, question):
+        """Offer to save unsaved changes, returns False if the user cancelled or saving failed"""
+        if not self.dirty:
+            return True
+        
+        buttons = (QMessageBox.StandardButton.Save | QMessageBox.StandardButton.Discard
+                   | QMessageBox.StandardButton.Cancel)
+        reply = QMessageBox.question(self, "Unsaved Changes", question, buttons)
+        if reply == QMessageBox.StandardButton.Cancel:
+            return False
+        if reply == QMessageBox.StandardButton.Save:
+            self.save_squad_file()
+            # Saving failed if the changes are still unsaved
+            return not self.dirty
+        return True
+    
+    def closeEvent(self, event):
+        """Offer to save unsaved changes before closing"""
+        if self.confirm_discard_changes("Save your changes to the squad file before closing?"):
+            event.accept()
+        else:
+            event.ignore()
+    
     def refresh_all_tabs(self):
         """Refresh all tabs with current data"""
-        # Remove all tabs
-        while self.tabs.count():
-            self.tabs.removeTab(0)
-        
-        # Re-add all tabs
-        self.setup_countries_tab()
-        self.setup_leagues_tab()
-        self.setup_teams_tab()
-        self.setup_players_tab()
-        self.setup_stadiums_tab()
-        self.setup_tournaments_tab()
-        self.setup_kits_tab()
+        if self.tabs.count():
+            # Tabs that are already built keep their widgets and only swap the model data
+            for data_name, model in self.models.items():
+                model.set_rows(getattr(self, data_name))
+            return
+        
+        # Add placeholders, each tab is built on first display
+        self.tabs.blockSignals(True)
+        for title, _ in self.tab_setups:
+            self.tabs.addTab(QWidget(), title)
+        self.tabs.blockSignals(False)
+        self.on_tab_changed(self.tabs.currentIndex())
+    
+    def on_tab_changed(self, index):
+        """Build a tab the first time it becomes visible"""
+        if index < 0 or self.tab_built[index]:
+            return
+        
+        title, setup = self.tab_setups[index]
+        tab = setup()
+        
+        # Swap the placeholder for the real tab
+        self.tabs.blockSignals(True)
+        placeholder = self.tabs.widget(index)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, tab, title)
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+        
+        self.tab_built[index] = True
+    
+    def create_table_view(self, model, search_edit, resize_modes=None):
+        """Create a table view over a model with fixed-height rows, filtered by a search box"""
+        view = QTableView()
+        
+        # Filter in the proxy model instead of hiding rows one by one
+        proxy = SquadFilterProxyModel(view)
+        proxy.setSourceModel(model)
+        
+        # Only filter once typing pauses
+        search_timer = QTimer(view)
+        search_timer.setSingleShot(True)
+        search_timer.setInterval(120)
+        search_timer.timeout.connect(lambda: proxy.set_search(search_edit.text()))
+        search_edit.textChanged.connect(lambda text: search_timer.start())
+        
+        # Configure everything before the first paint
+        view.setUpdatesEnabled(False)
+        view.setSortingEnabled(False)
+        view.setModel(proxy)
+        view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        
+        # Single-line cells with fixed row heights so Qt doesn't measure every row
+        view.setWordWrap(False)
+        vertical_header = view.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(24)
+        
+        # Set column widths, plain numbers are fixed pixel widths
+        if resize_modes:
+            header = view.horizontalHeader()
+            for column, mode in enumerate(resize_modes):
+                if isinstance(mode, int):
+                    header.setSectionResizeMode(column, QHeaderView.ResizeMode.Fixed)
+                    header.resizeSection(column, mode)
+                else:
+                    header.setSectionResizeMode(column, mode)
+        
+        view.setUpdatesEnabled(True)
+        return view
     
     def setup_countries_tab(self):
         tab = QWidget()
@@ -198,7 +502,6 @@ class FC25Editor(QMainWindow):
         search_label = QLabel("Search:")
         search_edit = QLineEdit()
         search_edit.setPlaceholderText("Search countries...")
-        search_edit.textChanged.connect(self.filter_countries)
         search_layout.addWidget(search_label)
         search_layout.addWidget(search_edit)
         top_layout.addLayout(search_layout)
@@ -224,27 +527,17 @@ class FC25Editor(QMainWindow):
         # Countries table
         table_group = QGroupBox("Countries List")
         table_layout = QVBoxLayout()
-        self.countries_table = QTableWidget()
-        self.countries_table.setColumnCount(4)
-        self.countries_table.setHorizontalHeaderLabels(["ID", "Name", "Confederation", "Rating"])
-        
-        # Set column widths
-        header = self.countries_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
-        
-        # Add data from squad file
-        for country_id, data in self.squad_file.get_countries().items():
-            row = self.countries_table.rowCount()
-            self.countries_table.insertRow(row)
-            self.countries_table.setItem(row, 0, QTableWidgetItem(country_id))
-            self.countries_table.setItem(row, 1, QTableWidgetItem(data[0]))  # Name
-            self.countries_table.setItem(row, 2, QTableWidgetItem(data[3]))  # Confederation
-            self.countries_table.setItem(row, 3, QTableWidgetItem(data[6]))  # Rating
-        
-        self.countries_table.currentItemChanged.connect(self.show_country_details)
+        self.countries_model = SquadTableModel(
+            ["ID", "Name", "Confederation", "Rating"], [0, 3, 6],
+            self.countries, self
+        )
+        stretch = QHeaderView.ResizeMode.Stretch
+        self.models["countries"] = self.countries_model
+        self.countries_table = self.create_table_view(
+            self.countries_model, search_edit, [50, stretch, 110, 60]
+        )
+        
+        self.countries_table.selectionModel().currentRowChanged.connect(self.show_country_details)
         table_layout.addWidget(self.countries_table)
         table_group.setLayout(table_layout)
         split_layout.addWidget(table_group, stretch=1)
@@ -312,28 +605,18 @@ class FC25Editor(QMainWindow):
         split_layout.addWidget(details_group, stretch=1)
         
         layout.addLayout(split_layout)
-        self.tabs.addTab(tab, "Countries")
-    
-    def filter_countries(self, text):
-        for row in range(self.countries_table.rowCount()):
-            should_show = False
-            for col in range(self.countries_table.columnCount()):
-                item = self.countries_table.item(row, col)
-                if item and text.lower() in item.text().lower():
-                    should_show = True
-                    break
-            self.countries_table.setRowHidden(row, not should_show)
+        return tab
     
     def show_country_details(self, current, previous):
-        if not current:
+        if not current.isValid():
             return
             
-        row = current.row()
-        country_id = self.countries_table.item(row, 0).text()
-        country_data = self.squad_file.get_countries().get(country_id)
+        row = self.countries_table.model().mapToSource(current).row()
+        country_id = self.countries_model.row_id(row)
+        country_data = self.countries.get(country_id)
         
         if country_data:
-            self.country_id_edit.setText(country_id)
+            self.country_id_edit.setText(str(country_id))
             self.country_name_edit.setText(country_data[0])
             self.country_short_name_edit.setText(country_data[1])
             self.country_abbrev_edit.setText(country_data[2])
@@ -344,11 +627,12 @@ class FC25Editor(QMainWindow):
             self.flag_code_edit.setText(country_data[7])
     
     def save_country_changes(self):
-        current_row = self.countries_table.currentRow()
+        current = self.countries_table.currentIndex()
+        current_row = self.countries_table.model().mapToSource(current).row()
         if current_row < 0:
             return
             
-        country_id = self.country_id_edit.text()
+        country_id = self.countries_model.row_id(current_row)
         new_data = [
             self.country_name_edit.text(),
             self.country_short_name_edit.text(),
@@ -360,74 +644,38 @@ class FC25Editor(QMainWindow):
             self.flag_code_edit.text()
         ]
         
-        # Update squad file
+        # Update squad file, written to disk on File > Save
         self.squad_file.update_country(country_id, new_data)
+        self.dirty = True
         
         # Update table
-        self.countries_table.setItem(current_row, 1, QTableWidgetItem(new_data[0]))
-        self.countries_table.setItem(current_row, 2, QTableWidgetItem(new_data[3]))
-        self.countries_table.setItem(current_row, 3, QTableWidgetItem(new_data[6]))
+        self.countries_model.refresh_row(current_row)
         
-        QMessageBox.information(self, "Success", "Country data saved successfully!")
+        QMessageBox.information(self, "Success", "Country data updated. Use File > Save to write it to the squad file.")
     
     def refresh_countries(self):
-        current_row = self.countries_table.currentRow()
-        if current_row >= 0:
-            self.show_country_details(self.countries_table.item(current_row, 0), None)
+        self.show_country_details(self.countries_table.currentIndex(), None)
     
-    def setup_leagues_tab(self):
+    def setup_simple_tab(self, title):
+        """Build a tab with a search bar and a table of one of the SIMPLE_TABS"""
+        data_name, headers, columns = self.SIMPLE_TABS[title]
         tab = QWidget()
         layout = QVBoxLayout(tab)
         
         # Search bar
         search_layout = QHBoxLayout()
         search_edit = QLineEdit()
-        search_edit.setPlaceholderText("Search leagues...")
+        search_edit.setPlaceholderText(f"Search {title.lower()}...")
         search_layout.addWidget(search_edit)
         layout.addLayout(search_layout)
         
-        # Leagues table
-        table = QTableWidget()
-        table.setColumnCount(5)
-        table.setHorizontalHeaderLabels(["ID", "Name", "Country", "Division", "Teams"])
-        
-        # Add data
-        for league_id, data in self.squad_file.get_leagues().items():
-            row = table.rowCount()
-            table.insertRow(row)
-            table.setItem(row, 0, QTableWidgetItem(league_id))
-            for col, value in enumerate(data[:4], 1):
-                table.setItem(row, col, QTableWidgetItem(str(value)))
+        # Data table
+        model = SquadTableModel(headers, columns, getattr(self, data_name), self)
+        self.models[data_name] = model
+        table = self.create_table_view(model, search_edit)
         
         layout.addWidget(table)
-        self.tabs.addTab(tab, "Leagues")
-    
-    def setup_teams_tab(self):
-        tab = QWidget()
-        layout = QVBoxLayout(tab)
-        
-        # Search bar
-        search_layout = QHBoxLayout()
-        search_edit = QLineEdit()
-        search_edit.setPlaceholderText("Search teams...")
-        search_layout.addWidget(search_edit)
-        layout.addLayout(search_layout)
-        
-        # Teams table
-        table = QTableWidget()
-        table.setColumnCount(7)
-        table.setHorizontalHeaderLabels(["ID", "Name", "League", "OVR", "ATT", "MID", "DEF"])
-        
-        # Add data
-        for team_id, data in self.squad_file.get_teams().items():
-            row = table.rowCount()
-            table.insertRow(row)
-            table.setItem(row, 0, QTableWidgetItem(team_id))
-            for col, value in enumerate(data[:6], 1):
-                table.setItem(row, col, QTableWidgetItem(str(value)))
-        
-        layout.addWidget(table)
-        self.tabs.addTab(tab, "Teams")
+        return tab
     
     def setup_players_tab(self):
         tab = QWidget()
@@ -437,7 +685,6 @@ class FC25Editor(QMainWindow):
         search_layout = QHBoxLayout()
         search_edit = QLineEdit()
         search_edit.setPlaceholderText("Search players...")
-        search_edit.textChanged.connect(self.filter_players)
         search_layout.addWidget(search_edit)
         layout.addLayout(search_layout)
         
@@ -447,37 +694,18 @@ class FC25Editor(QMainWindow):
         # Players table
         table_group = QGroupBox("Players")
         table_layout = QVBoxLayout()
-        self.players_table = QTableWidget()
-        self.players_table.setColumnCount(11)
-        self.players_table.setHorizontalHeaderLabels([
-            "ID", "Name", "OVR", "POS", "Age", "Team", "League", "NAT", "Height", "Weight", "Foot"
+        self.players_model = SquadTableModel(
+            ["ID", "Name", "OVR", "POS", "Age", "Team", "League", "NAT", "Height", "Weight", "Foot"],
+            [0, 1, 2, 3, 4, 9, 5, 6, 7, 8],
+            self.players, self
+        )
+        stretch = QHeaderView.ResizeMode.Stretch
+        self.models["players"] = self.players_model
+        self.players_table = self.create_table_view(self.players_model, search_edit, [
+            70, stretch, 40, 50, 40, stretch, stretch, 100, 60, 60, 50
         ])
         
-        # Set column widths
-        header = self.players_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(5, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(6, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(7, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(8, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(9, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(10, QHeaderView.ResizeMode.ResizeToContents)
-        
-        # Add data
-        for player_id, data in self.squad_file.get_players().items():
-            row = self.players_table.rowCount()
-            self.players_table.insertRow(row)
-            self.players_table.setItem(row, 0, QTableWidgetItem(player_id))
-            for col, value in enumerate(data[:10], 1):
-                if isinstance(value, dict):
-                    continue
-                self.players_table.setItem(row, col, QTableWidgetItem(str(value)))
-        
-        self.players_table.currentItemChanged.connect(self.show_player_details)
+        self.players_table.selectionModel().currentRowChanged.connect(self.show_player_details)
         table_layout.addWidget(self.players_table)
         table_group.setLayout(table_layout)
         split_layout.addWidget(table_group, stretch=2)
@@ -527,24 +755,28 @@ class FC25Editor(QMainWindow):
         # Attack Stats
         attack_group = QGroupBox("Attack Stats")
         self.attack_layout = QFormLayout()
+        self.attack_labels = {}
         attack_group.setLayout(self.attack_layout)
         self.details_form.addRow(attack_group)
         
         # Midfield Stats
         midfield_group = QGroupBox("Midfield Stats")
         self.midfield_layout = QFormLayout()
+        self.midfield_labels = {}
         midfield_group.setLayout(self.midfield_layout)
         self.details_form.addRow(midfield_group)
         
         # Defense Stats
         defense_group = QGroupBox("Defense Stats")
         self.defense_layout = QFormLayout()
+        self.defense_labels = {}
         defense_group.setLayout(self.defense_layout)
         self.details_form.addRow(defense_group)
         
         # GK Stats
         gk_group = QGroupBox("Goalkeeper Stats")
         self.gk_layout = QFormLayout()
+        self.gk_labels = {}
         gk_group.setLayout(self.gk_layout)
         self.details_form.addRow(gk_group)
         
@@ -554,19 +786,19 @@ class FC25Editor(QMainWindow):
         split_layout.addWidget(details_group, stretch=1)
         
         layout.addLayout(split_layout)
-        self.tabs.addTab(tab, "Players")
+        return tab
     
     def show_player_details(self, current, previous):
-        if not current:
+        if not current.isValid():
             return
             
-        row = current.row()
-        player_id = self.players_table.item(row, 0).text()
-        player_data = self.squad_file.get_players().get(player_id)
+        row = self.players_table.model().mapToSource(current).row()
+        player_id = self.players_model.row_id(row)
+        player_data = self.players[player_id]
         
         # Update basic info
         self.name_label.setText(player_data[0])
-        self.ovr_label.setText(player_data[1])
+        self.ovr_label.setText(str(player_data[1]))
         self.pos_label.setText(player_data[2])
         self.team_label.setText(player_data[4])
         self.league_label.setText(player_data[9])
@@ -575,226 +807,37 @@ class FC25Editor(QMainWindow):
         self.weight_label.setText(f"{player_data[7]} kg")
         self.foot_label.setText(player_data[8])
         
-        # Clear previous stats
-        self.clear_layout(self.attack_layout)
-        self.clear_layout(self.midfield_layout)
-        self.clear_layout(self.defense_layout)
-        self.clear_layout(self.gk_layout)
-        
-        # Update stats
-        attack_stats = player_data[10]
-        for stat, value in attack_stats.items():
-            self.attack_layout.addRow(f"{stat}:", QLabel(value))
-            
-        midfield_stats = player_data[11]
-        for stat, value in midfield_stats.items():
-            self.midfield_layout.addRow(f"{stat}:", QLabel(value))
-            
-        defense_stats = player_data[12]
-        for stat, value in defense_stats.items():
-            self.defense_layout.addRow(f"{stat}:", QLabel(value))
-            
-        gk_stats = player_data[13]
-        for stat, value in gk_stats.items():
-            self.gk_layout.addRow(f"{stat}:", QLabel(value))
-    
-    def clear_layout(self, layout):
-        while layout.count():
-            child = layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-    
-    def filter_players(self, text):
-        for row in range(self.players_table.rowCount()):
-            show = False
-            for col in range(1, 8):  # Search in name, team, league, nationality
-                item = self.players_table.item(row, col)
-                if item and text.lower() in item.text().lower():
-                    show = True
-                    break
-            self.players_table.setRowHidden(row, not show)
-    
-    def setup_stadiums_tab(self):
-        tab = QWidget()
-        layout = QVBoxLayout(tab)
-        
-        # Search bar
-        search_layout = QHBoxLayout()
-        search_edit = QLineEdit()
-        search_edit.setPlaceholderText("Search stadiums...")
-        search_layout.addWidget(search_edit)
-        layout.addLayout(search_layout)
-        
-        # Stadiums table
-        table = QTableWidget()
-        table.setColumnCount(7)
-        table.setHorizontalHeaderLabels([
-            "ID", "Name", "City", "Country", "Capacity", "Team", "Built"
-        ])
-        
-        # Add data
-        for stadium_id, data in self.squad_file.get_stadiums().items():
-            row = table.rowCount()
-            table.insertRow(row)
-            table.setItem(row, 0, QTableWidgetItem(stadium_id))
-            for col, value in enumerate(data[:6], 1):
-                table.setItem(row, col, QTableWidgetItem(str(value)))
-        
-        layout.addWidget(table)
-        self.tabs.addTab(tab, "Stadiums")
-    
-    def setup_tournaments_tab(self):
-        tab = QWidget()
-        layout = QVBoxLayout(tab)
-        
-        # Search bar
-        search_layout = QHBoxLayout()
-        search_edit = QLineEdit()
-        search_edit.setPlaceholderText("Search tournaments...")
-        search_layout.addWidget(search_edit)
-        layout.addLayout(search_layout)
-        
-        # Tournaments table
-        table = QTableWidget()
-        table.setColumnCount(7)
-        table.setHorizontalHeaderLabels([
-            "ID", "Name", "Type", "Region", "Teams", "Prize", "Champion"
-        ])
-        
-        # Add data
-        for tournament_id, data in self.squad_file.get_tournaments().items():
-            row = table.rowCount()
-            table.insertRow(row)
-            table.setItem(row, 0, QTableWidgetItem(tournament_id))
-            for col, value in enumerate(data, 1):
-                table.setItem(row, col, QTableWidgetItem(str(value)))
-        
-        layout.addWidget(table)
-        self.tabs.addTab(tab, "Tournaments")
-    
-    def setup_kits_tab(self):
-        tab = QWidget()
-        layout = QVBoxLayout(tab)
-        
-        # Search bar
-        search_layout = QHBoxLayout()
-        search_edit = QLineEdit()
-        search_edit.setPlaceholderText("Search kits...")
-        search_layout.addWidget(search_edit)
-        layout.addLayout(search_layout)
-        
-        # Kits table
-        table = QTableWidget()
-        table.setColumnCount(8)
-        table.setHorizontalHeaderLabels([
-            "ID", "Team", "Season", "Type", "Color 1", "Color 2", "Brand", "Sponsor"
-        ])
-        
-        # Add data
-        for kit_id, data in self.squad_file.get_kits().items():
-            row = table.rowCount()
-            table.insertRow(row)
-            table.setItem(row, 0, QTableWidgetItem(kit_id))
-            for col, value in enumerate(data, 1):
-                table.setItem(row, col, QTableWidgetItem(str(value)))
-        
-        layout.addWidget(table)
-        self.tabs.addTab(tab, "Kits")
+        # Update stats, rows that have them carry them packed after the player fields
+        stats = player_data[10] if len(player_data) > 10 else None
+        forms = [
+            (self.attack_layout, self.attack_labels),
+            (self.midfield_layout, self.midfield_labels),
+            (self.defense_layout, self.defense_labels),
+            (self.gk_layout, self.gk_labels)
+        ]
+        for (layout, labels), stat_names in zip(forms, default_players.STAT_GROUPS):
+            self.update_stat_rows(layout, labels, stat_names, stats)
     
-    def apply_dark_theme(self):
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            QTabWidget::pane {
-                border: 1px solid #555555;
-                background-color: #2b2b2b;
-            }
-            QTabBar::tab {
-                background-color: #353535;
-                color: #ffffff;
-                padding: 8px 20px;
-                border: 1px solid #555555;
-            }
-            QTabBar::tab:selected {
-                background-color: #454545;
-            }
-            QTableWidget {
-                background-color: #333333;
-                color: #ffffff;
-                gridline-color: #555555;
-            }
-            QHeaderView::section {
-                background-color: #404040;
-                color: #ffffff;
-                padding: 4px;
-                border: 1px solid #555555;
-            }
-            QLineEdit {
-                background-color: #333333;
-                color: #ffffff;
-                border: 1px solid #555555;
-                border-radius: 2px;
-                padding: 4px;
-            }
-            QPushButton {
-                background-color: #404040;
-                color: #ffffff;
-                border: 1px solid #555555;
-                border-radius: 2px;
-                padding: 5px;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #4a4a4a;
-            }
-            QPushButton:pressed {
-                background-color: #303030;
-            }
-            QGroupBox {
-                background-color: #2b2b2b;
-                color: #ffffff;
-                border: 1px solid #555555;
-                border-radius: 3px;
-                margin-top: 0.5em;
-                padding-top: 0.5em;
-            }
-            QGroupBox::title {
-                color: #ffffff;
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 3px 0 3px;
-            }
-            QLabel {
-                color: #ffffff;
-            }
-            QScrollArea {
-                border: none;
-            }
-            QScrollBar:vertical {
-                border: none;
-                background: #2b2b2b;
-                width: 10px;
-                margin: 0;
-            }
-            QScrollBar::handle:vertical {
-                background: #555555;
-                min-height: 20px;
-                border-radius: 5px;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                border: none;
-                background: none;
-            }
-        """)
+    def update_stat_rows(self, layout, labels, stat_names, stats):
+        """Show a group of packed stats in a form, or hide it if there are no stats"""
+        for stat in stat_names:
+            label = labels.get(stat)
+            if label is None:
+                label = QLabel()
+                labels[stat] = label
+                layout.addRow(f"{stat}:", label)
+            if stats is not None:
+                label.setText(str(stats[default_players.STAT_OFFSETS[stat]]))
+            layout.setRowVisible(label, stats is not None)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    app = QApplication(sys.argv)
+    app.setStyleSheet(FC25Editor.STYLESHEET)
     try:
-        app = QApplication(sys.argv)
         window = FC25Editor()
-        window.show()
-        sys.exit(app.exec())
     except Exception as e:
-        print(f"Fatal error: {str(e)}")
-        sys.exit(1)
\ No newline at end of file
+        sys.stderr.write(f"Fatal error: {e}\n")
+        sys.exit(1)
+    window.show()
+    sys.exit(app.exec())
\ No newline at end of file
@@ -1,88 +1,292 @@
-PLAYERS_DATABASE = {
-    # Format: "id": ["Name", "OVR", "Position", "Age", "Team", "Nationality", "Height", "Weight", "Preferred Foot", "League",
-    #                "Attack Stats", "Midfield Stats", "Defense Stats", "GK Stats"]
-    "158023": [
-        "Lionel Messi", "90", "RW", "36", "Inter Miami CF", "Argentina", "170", "72", "Left", "MLS",
-        {"Finishing": "92", "Shot Power": "86", "Long Shots": "88", "Volleys": "88", "Penalties": "75"},
-        {"Short Pass": "90", "Vision": "94", "Crossing": "85", "Free Kick": "90", "Curve": "93"},
-        {"Marking": "33", "Standing Tackle": "35", "Sliding Tackle": "24"},
-        {"GK Diving": "6", "GK Handling": "11", "GK Kicking": "15", "GK Positioning": "14", "GK Reflexes": "8"}
-    ],
-    "231747": [
-        "Kylian Mbappé", "91", "ST", "24", "Paris Saint-Germain", "France", "178", "73", "Right", "Ligue 1 Uber Eats",
-        {"Finishing": "93", "Shot Power": "88", "Long Shots": "83", "Volleys": "84", "Penalties": "76"},
-        {"Short Pass": "83", "Vision": "85", "Crossing": "77", "Free Kick": "69", "Curve": "81"},
-        {"Marking": "36", "Standing Tackle": "34", "Sliding Tackle": "30"},
-        {"GK Diving": "5", "GK Handling": "9", "GK Kicking": "7", "GK Positioning": "11", "GK Reflexes": "14"}
-    ],
-    "20801": [
-        "Erling Haaland", "91", "ST", "23", "Manchester City", "Norway", "195", "88", "Left", "Premier League",
-        {"Finishing": "95", "Shot Power": "94", "Long Shots": "85", "Volleys": "86", "Penalties": "85"},
-        {"Short Pass": "75", "Vision": "76", "Crossing": "55", "Free Kick": "62", "Curve": "66"},
-        {"Marking": "48", "Standing Tackle": "42", "Sliding Tackle": "38"},
-        {"GK Diving": "12", "GK Handling": "15", "GK Kicking": "11", "GK Positioning": "12", "GK Reflexes": "14"}
-    ],
-    "192985": [
-        "Kevin De Bruyne", "91", "CM", "32", "Manchester City", "Belgium", "181", "70", "Right", "Premier League",
-        {"Finishing": "82", "Shot Power": "90", "Long Shots": "88", "Volleys": "80", "Penalties": "75"},
-        {"Short Pass": "94", "Vision": "95", "Crossing": "94", "Free Kick": "85", "Curve": "88"},
-        {"Marking": "65", "Standing Tackle": "58", "Sliding Tackle": "55"},
-        {"GK Diving": "15", "GK Handling": "13", "GK Kicking": "15", "GK Positioning": "10", "GK Reflexes": "12"}
-    ],
-    "188545": [
-        "Robert Lewandowski", "90", "ST", "35", "Barcelona", "Poland", "185", "81", "Right", "LaLiga EA Sports",
-        {"Finishing": "94", "Shot Power": "88", "Long Shots": "85", "Volleys": "88", "Penalties": "90"},
-        {"Short Pass": "83", "Vision": "82", "Crossing": "66", "Free Kick": "77", "Curve": "78"},
-        {"Marking": "45", "Standing Tackle": "42", "Sliding Tackle": "38"},
-        {"GK Diving": "8", "GK Handling": "12", "GK Kicking": "10", "GK Positioning": "15", "GK Reflexes": "11"}
-    ],
-    "190871": [
-        "Neymar Jr", "89", "LW", "31", "Al Hilal", "Brazil", "175", "68", "Right", "Saudi Pro League",
-        {"Finishing": "87", "Shot Power": "82", "Long Shots": "82", "Volleys": "86", "Penalties": "90"},
-        {"Short Pass": "87", "Vision": "89", "Crossing": "85", "Free Kick": "87", "Curve": "92"},
-        {"Marking": "39", "Standing Tackle": "37", "Sliding Tackle": "33"},
-        {"GK Diving": "9", "GK Handling": "11", "GK Kicking": "8", "GK Positioning": "7", "GK Reflexes": "14"}
-    ],
-    "167495": [
-        "Mohamed Salah", "89", "RW", "31", "Liverpool", "Egypt", "175", "71", "Left", "Premier League",
-        {"Finishing": "90", "Shot Power": "86", "Long Shots": "84", "Volleys": "82", "Penalties": "85"},
-        {"Short Pass": "84", "Vision": "86", "Crossing": "84", "Free Kick": "78", "Curve": "86"},
-        {"Marking": "45", "Standing Tackle": "42", "Sliding Tackle": "38"},
-        {"GK Diving": "7", "GK Handling": "9", "GK Kicking": "11", "GK Positioning": "8", "GK Reflexes": "13"}
-    ],
-    "200389": [
-        "Virgil van Dijk", "89", "CB", "32", "Liverpool", "Netherlands", "195", "92", "Right", "Premier League",
-        {"Finishing": "60", "Shot Power": "85", "Long Shots": "64", "Volleys": "55", "Penalties": "65"},
-        {"Short Pass": "78", "Vision": "70", "Crossing": "60", "Free Kick": "65", "Curve": "60"},
-        {"Marking": "92", "Standing Tackle": "93", "Sliding Tackle": "88"},
-        {"GK Diving": "10", "GK Handling": "12", "GK Kicking": "15", "GK Positioning": "11", "GK Reflexes": "13"}
-    ],
-    "193080": [
-        "Thibaut Courtois", "90", "GK", "31", "Real Madrid", "Belgium", "200", "96", "Left", "LaLiga EA Sports",
-        {"Finishing": "12", "Shot Power": "32", "Long Shots": "12", "Volleys": "14", "Penalties": "25"},
-        {"Short Pass": "32", "Vision": "35", "Crossing": "15", "Free Kick": "12", "Curve": "18"},
-        {"Marking": "18", "Standing Tackle": "15", "Sliding Tackle": "12"},
-        {"GK Diving": "89", "GK Handling": "88", "GK Kicking": "78", "GK Positioning": "88", "GK Reflexes": "90"}
-    ],
-    "192448": [
-        "Harry Kane", "90", "ST", "30", "Bayern Munich", "England", "188", "86", "Right", "Bundesliga",
-        {"Finishing": "94", "Shot Power": "90", "Long Shots": "87", "Volleys": "88", "Penalties": "92"},
-        {"Short Pass": "85", "Vision": "87", "Crossing": "77", "Free Kick": "78", "Curve": "82"},
-        {"Marking": "52", "Standing Tackle": "48", "Sliding Tackle": "42"},
-        {"GK Diving": "11", "GK Handling": "14", "GK Kicking": "12", "GK Positioning": "10", "GK Reflexes": "15"}
-    ],
-    "202126": [
-        "Bruno Fernandes", "88", "CAM", "29", "Manchester United", "Portugal", "179", "69", "Right", "Premier League",
-        {"Finishing": "84", "Shot Power": "88", "Long Shots": "88", "Volleys": "85", "Penalties": "92"},
-        {"Short Pass": "90", "Vision": "92", "Crossing": "88", "Free Kick": "85", "Curve": "87"},
-        {"Marking": "68", "Standing Tackle": "62", "Sliding Tackle": "58"},
-        {"GK Diving": "12", "GK Handling": "10", "GK Kicking": "14", "GK Positioning": "11", "GK Reflexes": "13"}
-    ],
-    "208722": [
-        "Vinícius Jr.", "89", "LW", "23", "Real Madrid", "Brazil", "176", "73", "Right", "LaLiga EA Sports",
-        {"Finishing": "85", "Shot Power": "82", "Long Shots": "78", "Volleys": "82", "Penalties": "75"},
-        {"Short Pass": "82", "Vision": "84", "Crossing": "80", "Free Kick": "72", "Curve": "85"},
-        {"Marking": "42", "Standing Tackle": "38", "Sliding Tackle": "35"},
-        {"GK Diving": "8", "GK Handling": "10", "GK Kicking": "12", "GK Positioning": "9", "GK Reflexes": "11"}
-    ]
-} 
\ No newline at end of file
+import sys
+from collections import defaultdict, namedtuple
+
+import numpy as np
+
+from .snapshot import load_snapshot, load_array_snapshot
+
+# Stats of the four stat groups (row fields 10-13) in the order they are listed
+STAT_NAMES = (
+    "Finishing", "Shot Power", "Long Shots", "Volleys", "Penalties",
+    "Short Pass", "Vision", "Crossing", "Free Kick", "Curve",
+    "Marking", "Standing Tackle", "Sliding Tackle",
+    "GK Diving", "GK Handling", "GK Kicking", "GK Positioning", "GK Reflexes"
+)
+
+# Stats of the attack, midfield, defense and GK groups
+STAT_GROUPS = (STAT_NAMES[:5], STAT_NAMES[5:10], STAT_NAMES[10:13], STAT_NAMES[13:])
+
+# Offset of each stat within the packed stats of a player
+STAT_OFFSETS = {stat: offset for offset, stat in enumerate(STAT_NAMES)}
+
+# All stats of a player, fields are the stat names in snake case (finishing, shot_power, ...)
+PlayerStats = namedtuple("PlayerStats", [stat.lower().replace(" ", "_") for stat in STAT_NAMES])
+
+# Names of the rows of NUMERIC_COLUMNS, as accepted by query()
+NUMERIC_FIELDS = ("ovr", "age", "height", "weight") + PlayerStats._fields
+
+
+class Player:
+    """A default player with named fields, built from a PLAYERS_DATABASE row"""
+    __slots__ = ("player_id", "name", "ovr", "position", "age", "team", "nationality",
+                 "height", "weight", "foot", "league", "index")
+    
+    def __init__(self, player_id, row, index):
+        self.player_id = player_id
+        (self.name, self.ovr, self.position, self.age, self.team, self.nationality,
+         self.height, self.weight, self.foot, self.league) = row[:10]
+        self.index = index
+    
+    @property
+    def stats(self):
+        """All stats of the player, read from STAT_MATRIX"""
+        return PlayerStats._make(STAT_MATRIX[self.index].tolist())
+    
+    def __repr__(self):
+        return f"Player({self.player_id!r}, {self.name!r}, ovr={self.ovr})"
+
+
+def build_database():
+    """Build the default players database"""
+    return {
+        # Format: id: ["Name", OVR, "Position", Age, "Team", "Nationality", Height, Weight, "Preferred Foot", "League",
+        #                "Attack Stats", "Midfield Stats", "Defense Stats", "GK Stats"]
+        158023: [
+            "Lionel Messi", 90, "RW", 36, "Inter Miami CF", "Argentina", 170, 72, "Left", "MLS",
+            {"Finishing": 92, "Shot Power": 86, "Long Shots": 88, "Volleys": 88, "Penalties": 75},
+            {"Short Pass": 90, "Vision": 94, "Crossing": 85, "Free Kick": 90, "Curve": 93},
+            {"Marking": 33, "Standing Tackle": 35, "Sliding Tackle": 24},
+            {"GK Diving": 6, "GK Handling": 11, "GK Kicking": 15, "GK Positioning": 14, "GK Reflexes": 8}
+        ],
+        231747: [
+            "Kylian Mbappé", 91, "ST", 24, "Paris Saint-Germain", "France", 178, 73, "Right", "Ligue 1 Uber Eats",
+            {"Finishing": 93, "Shot Power": 88, "Long Shots": 83, "Volleys": 84, "Penalties": 76},
+            {"Short Pass": 83, "Vision": 85, "Crossing": 77, "Free Kick": 69, "Curve": 81},
+            {"Marking": 36, "Standing Tackle": 34, "Sliding Tackle": 30},
+            {"GK Diving": 5, "GK Handling": 9, "GK Kicking": 7, "GK Positioning": 11, "GK Reflexes": 14}
+        ],
+        20801: [
+            "Erling Haaland", 91, "ST", 23, "Manchester City", "Norway", 195, 88, "Left", "Premier League",
+            {"Finishing": 95, "Shot Power": 94, "Long Shots": 85, "Volleys": 86, "Penalties": 85},
+            {"Short Pass": 75, "Vision": 76, "Crossing": 55, "Free Kick": 62, "Curve": 66},
+            {"Marking": 48, "Standing Tackle": 42, "Sliding Tackle": 38},
+            {"GK Diving": 12, "GK Handling": 15, "GK Kicking": 11, "GK Positioning": 12, "GK Reflexes": 14}
+        ],
+        192985: [
+            "Kevin De Bruyne", 91, "CM", 32, "Manchester City", "Belgium", 181, 70, "Right", "Premier League",
+            {"Finishing": 82, "Shot Power": 90, "Long Shots": 88, "Volleys": 80, "Penalties": 75},
+            {"Short Pass": 94, "Vision": 95, "Crossing": 94, "Free Kick": 85, "Curve": 88},
+            {"Marking": 65, "Standing Tackle": 58, "Sliding Tackle": 55},
+            {"GK Diving": 15, "GK Handling": 13, "GK Kicking": 15, "GK Positioning": 10, "GK Reflexes": 12}
+        ],
+        188545: [
+            "Robert Lewandowski", 90, "ST", 35, "Barcelona", "Poland", 185, 81, "Right", "LaLiga EA Sports",
+            {"Finishing": 94, "Shot Power": 88, "Long Shots": 85, "Volleys": 88, "Penalties": 90},
+            {"Short Pass": 83, "Vision": 82, "Crossing": 66, "Free Kick": 77, "Curve": 78},
+            {"Marking": 45, "Standing Tackle": 42, "Sliding Tackle": 38},
+            {"GK Diving": 8, "GK Handling": 12, "GK Kicking": 10, "GK Positioning": 15, "GK Reflexes": 11}
+        ],
+        190871: [
+            "Neymar Jr", 89, "LW", 31, "Al Hilal", "Brazil", 175, 68, "Right", "Saudi Pro League",
+            {"Finishing": 87, "Shot Power": 82, "Long Shots": 82, "Volleys": 86, "Penalties": 90},
+            {"Short Pass": 87, "Vision": 89, "Crossing": 85, "Free Kick": 87, "Curve": 92},
+            {"Marking": 39, "Standing Tackle": 37, "Sliding Tackle": 33},
+            {"GK Diving": 9, "GK Handling": 11, "GK Kicking": 8, "GK Positioning": 7, "GK Reflexes": 14}
+        ],
+        167495: [
+            "Mohamed Salah", 89, "RW", 31, "Liverpool", "Egypt", 175, 71, "Left", "Premier League",
+            {"Finishing": 90, "Shot Power": 86, "Long Shots": 84, "Volleys": 82, "Penalties": 85},
+            {"Short Pass": 84, "Vision": 86, "Crossing": 84, "Free Kick": 78, "Curve": 86},
+            {"Marking": 45, "Standing Tackle": 42, "Sliding Tackle": 38},
+            {"GK Diving": 7, "GK Handling": 9, "GK Kicking": 11, "GK Positioning": 8, "GK Reflexes": 13}
+        ],
+        200389: [
+            "Virgil van Dijk", 89, "CB", 32, "Liverpool", "Netherlands", 195, 92, "Right", "Premier League",
+            {"Finishing": 60, "Shot Power": 85, "Long Shots": 64, "Volleys": 55, "Penalties": 65},
+            {"Short Pass": 78, "Vision": 70, "Crossing": 60, "Free Kick": 65, "Curve": 60},
+            {"Marking": 92, "Standing Tackle": 93, "Sliding Tackle": 88},
+            {"GK Diving": 10, "GK Handling": 12, "GK Kicking": 15, "GK Positioning": 11, "GK Reflexes": 13}
+        ],
+        193080: [
+            "Thibaut Courtois", 90, "GK", 31, "Real Madrid", "Belgium", 200, 96, "Left", "LaLiga EA Sports",
+            {"Finishing": 12, "Shot Power": 32, "Long Shots": 12, "Volleys": 14, "Penalties": 25},
+            {"Short Pass": 32, "Vision": 35, "Crossing": 15, "Free Kick": 12, "Curve": 18},
+            {"Marking": 18, "Standing Tackle": 15, "Sliding Tackle": 12},
+            {"GK Diving": 89, "GK Handling": 88, "GK Kicking": 78, "GK Positioning": 88, "GK Reflexes": 90}
+        ],
+        192448: [
+            "Harry Kane", 90, "ST", 30, "Bayern Munich", "England", 188, 86, "Right", "Bundesliga",
+            {"Finishing": 94, "Shot Power": 90, "Long Shots": 87, "Volleys": 88, "Penalties": 92},
+            {"Short Pass": 85, "Vision": 87, "Crossing": 77, "Free Kick": 78, "Curve": 82},
+            {"Marking": 52, "Standing Tackle": 48, "Sliding Tackle": 42},
+            {"GK Diving": 11, "GK Handling": 14, "GK Kicking": 12, "GK Positioning": 10, "GK Reflexes": 15}
+        ],
+        202126: [
+            "Bruno Fernandes", 88, "CAM", 29, "Manchester United", "Portugal", 179, 69, "Right", "Premier League",
+            {"Finishing": 84, "Shot Power": 88, "Long Shots": 88, "Volleys": 85, "Penalties": 92},
+            {"Short Pass": 90, "Vision": 92, "Crossing": 88, "Free Kick": 85, "Curve": 87},
+            {"Marking": 68, "Standing Tackle": 62, "Sliding Tackle": 58},
+            {"GK Diving": 12, "GK Handling": 10, "GK Kicking": 14, "GK Positioning": 11, "GK Reflexes": 13}
+        ],
+        208722: [
+            "Vinícius Jr.", 89, "LW", 23, "Real Madrid", "Brazil", 176, 73, "Right", "LaLiga EA Sports",
+            {"Finishing": 85, "Shot Power": 82, "Long Shots": 78, "Volleys": 82, "Penalties": 75},
+            {"Short Pass": 82, "Vision": 84, "Crossing": 80, "Free Kick": 72, "Curve": 85},
+            {"Marking": 42, "Standing Tackle": 38, "Sliding Tackle": 35},
+            {"GK Diving": 8, "GK Handling": 10, "GK Kicking": 12, "GK Positioning": 9, "GK Reflexes": 11}
+        ]
+    }
+
+
+def _intern_row(row):
+    """Share one object per distinct string across the fields of a player row"""
+    row[:10] = [sys.intern(value) if isinstance(value, str) else value for value in row[:10]]
+
+
+def _column(values, dtype):
+    """Build one column array over the players"""
+    return np.array(list(values), dtype=dtype)
+
+
+def _stat(row, stat):
+    """Look up a stat in whichever stat group of a player row holds it"""
+    for group in row[10:14]:
+        if stat in group:
+            return group[stat]
+    return 0
+
+
+def _index(database, field):
+    """Map each value of a row field to the IDs of the players that have it"""
+    index = defaultdict(list)
+    for player_id, row in database.items():
+        index[row[field]].append(player_id)
+    return dict(index)
+
+
+def build_numeric_table(database):
+    """Build the uint8 table of the numeric player fields, one row per player in NUMERIC_FIELDS order"""
+    return np.array([[row[1], row[3], row[6], row[7]] + [_stat(row, stat) for stat in STAT_NAMES]
+                     for row in database.values()], dtype=np.uint8)
+
+
+# Module attributes built on first access, importing the module does not load any player
+_LAZY_NAMES = frozenset([
+    "PLAYERS_DATABASE", "PLAYER_IDS", "ID_TO_ROW", "NAMES", "POSITIONS", "TEAMS", "NATIONALITIES",
+    "PREFERRED_FEET", "LEAGUES", "NUMERIC_COLUMNS", "OVR", "AGES", "HEIGHTS", "WEIGHTS",
+    "STAT_ARRAYS", "STAT_MATRIX", "PLAYERS", "BY_TEAM", "BY_POS", "BY_NAT", "BY_LEAGUE"
+])
+
+
+def _load():
+    """Load the players database and build everything derived from it"""
+    global PLAYERS_DATABASE, PLAYER_IDS, ID_TO_ROW, NAMES, POSITIONS, TEAMS, NATIONALITIES
+    global PREFERRED_FEET, LEAGUES, NUMERIC_COLUMNS, OVR, AGES, HEIGHTS, WEIGHTS
+    global STAT_ARRAYS, STAT_MATRIX, PLAYERS, BY_TEAM, BY_POS, BY_NAT, BY_LEAGUE
+    
+    database = load_snapshot(__file__, build_database)
+    
+    # The numeric fields are memory-mapped from a snapshot rather than built on import. Every
+    # other numeric array is a view of this one table, nothing is stored twice.
+    numeric_table = load_array_snapshot(__file__, "numeric", lambda: build_numeric_table(database),
+                                        shape=(len(database), len(NUMERIC_FIELDS)))
+    
+    # The stats are only kept in the table, rows keep the ten player fields and a view of their stats
+    for row in database.values():
+        del row[10:]
+        _intern_row(row)
+    
+    # Column arrays over the players, index i of every array is the player PLAYER_IDS[i]
+    rows = list(database.values())
+    PLAYER_IDS = _column(database, None)
+    ID_TO_ROW = {player_id: i for i, player_id in enumerate(database)}
+    NAMES = _column((row[0] for row in rows), object)
+    POSITIONS = _column((row[2] for row in rows), object)
+    TEAMS = _column((row[4] for row in rows), object)
+    NATIONALITIES = _column((row[5] for row in rows), object)
+    PREFERRED_FEET = _column((row[8] for row in rows), object)
+    LEAGUES = _column((row[9] for row in rows), object)
+    
+    # One row per numeric field, as views of the numeric table
+    NUMERIC_COLUMNS = numeric_table.T
+    OVR, AGES, HEIGHTS, WEIGHTS = NUMERIC_COLUMNS[:4]
+    
+    # The stats of all players, the stats of one player are packed together in STAT_NAMES order
+    STAT_MATRIX = numeric_table[:, 4:]
+    STAT_ARRAYS = dict(zip(STAT_NAMES, STAT_MATRIX.T))
+    for row, stats in zip(rows, STAT_MATRIX):
+        row.append(memoryview(stats))
+    
+    PLAYERS = {player_id: Player(player_id, row, i) for i, (player_id, row) in enumerate(database.items())}
+    
+    # Player IDs by team, position, nationality and league
+    BY_TEAM = _index(database, 4)
+    BY_POS = _index(database, 2)
+    BY_NAT = _index(database, 5)
+    BY_LEAGUE = _index(database, 9)
+    
+    PLAYERS_DATABASE = database
+
+
+def __getattr__(name):
+    """Load the players the first time one of the lazy attributes is read"""
+    if name in _LAZY_NAMES:
+        _load()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_player(player_id):
+    """Get the row of a player, the ten player fields and then its packed stats, indexed by STAT_OFFSETS"""
+    if "PLAYERS_DATABASE" not in globals():
+        _load()
+    return PLAYERS_DATABASE[player_id]
+
+
+def query(**minimums):
+    """Get the IDs of the players reaching every minimum, e.g. query(ovr=88, finishing=85)"""
+    if "NUMERIC_COLUMNS" not in globals():
+        _load()
+    mask = np.ones(len(PLAYER_IDS), dtype=bool)
+    for field, minimum in minimums.items():
+        if field not in NUMERIC_FIELDS:
+            raise ValueError(f"Unknown player field: {field}")
+        mask &= NUMERIC_COLUMNS[NUMERIC_FIELDS.index(field)] >= minimum
+    return PLAYER_IDS[mask]
+
+
+def best_xi(weights):
+    """Pick a different player for each lineup slot, greedily by the slot's weighted stat score
+
+    ``weights`` holds one row of stat weights per slot, in STAT_NAMES order.
+    Slots are filled in order, each taking the best player left.
+    """
+    if "STAT_MATRIX" not in globals():
+        _load()
+    weights = np.asarray(weights, dtype=np.float32)
+    if weights.ndim != 2 or weights.shape[1] != len(STAT_NAMES):
+        raise ValueError(f"Expected one row of {len(STAT_NAMES)} stat weights per slot")
+    if len(weights) > len(PLAYER_IDS):
+        raise ValueError(f"Cannot fill {len(weights)} slots with {len(PLAYER_IDS)} players")
+    
+    # Score of every player in every slot in one matrix product
+    scores = weights @ STAT_MATRIX.T.astype(np.float32)
+    picked = []
+    for slot_scores in scores:
+        slot_scores[picked] = -np.inf
+        picked.append(int(np.argmax(slot_scores)))
+    return PLAYER_IDS[picked]
+
+
+def get_stat(player_id, stat):
+    """Get one stat of a player by its name in STAT_NAMES, read from the packed stats"""
+    if "STAT_MATRIX" not in globals():
+        _load()
+    return int(STAT_MATRIX[ID_TO_ROW[player_id], STAT_OFFSETS[stat]])
+
+
+def get_stat_bytes(player_id):
+    """Get the packed stats of a player, indexed by STAT_OFFSETS, without copying them"""
+    if "STAT_MATRIX" not in globals():
+        _load()
+    return memoryview(STAT_MATRIX[ID_TO_ROW[player_id]])
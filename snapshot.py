@@ -0,0 +1,93 @@
+"""
+Snapshots of the database modules
+Each database dict is marshalled next to its module the first time it is built,
+later imports unmarshal it instead of executing the Python literal again.
+The payload carries a CRC32 checksum so a damaged snapshot is rebuilt
+rather than loaded.
+"""
+import os
+import zlib
+import marshal
+import logging
+
+import numpy as np
+
+SNAPSHOT_SUFFIX = '.marshal'
+ARRAY_SUFFIX = '.npy'
+KEY_SUFFIX = '.key'
+
+logger = logging.getLogger(__name__)
+
+
+def _source_key(source_file):
+    """Identify the current contents of a module source and the marshal format"""
+    stat = os.stat(source_file)
+    return (stat.st_mtime_ns, stat.st_size, marshal.version)
+
+
+def load_snapshot(source_file, build):
+    """Load the dict built by ``build`` from the snapshot of ``source_file``
+
+    The snapshot is rebuilt whenever it is missing, unreadable, fails its
+    checksum or is older than the module source.
+    """
+    snapshot_path = os.path.splitext(source_file)[0] + SNAPSHOT_SUFFIX
+    key = _source_key(source_file)
+    
+    try:
+        with open(snapshot_path, 'rb') as f:
+            snapshot_key, checksum, payload = marshal.load(f)
+        if snapshot_key == key:
+            if zlib.crc32(payload) == checksum:
+                return marshal.loads(payload)
+            logger.warning(f"Snapshot {snapshot_path} failed its checksum, rebuilding it")
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable snapshot {snapshot_path}: {str(e)}")
+    
+    data = build()
+    try:
+        payload = marshal.dumps(data)
+        with open(snapshot_path, 'wb') as f:
+            marshal.dump((key, zlib.crc32(payload), payload), f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Failed to write snapshot {snapshot_path}: {str(e)}")
+    return data
+
+
+def load_array_snapshot(source_file, name, build, shape=None):
+    """Memory-map the array built by ``build`` from its snapshot next to ``source_file``
+
+    The returned array is a read-only view of the mapped file, nothing is
+    copied until it is read. The snapshot is rebuilt whenever it is missing,
+    unreadable, was built from a different module source than the current
+    one or does not have the expected ``shape``.
+    """
+    snapshot_path = f"{os.path.splitext(source_file)[0]}_{name}{ARRAY_SUFFIX}"
+    # The .npy format has no room for the source key, it is kept in a file of its own
+    key_path = snapshot_path + KEY_SUFFIX
+    key = _source_key(source_file)
+    
+    try:
+        with open(key_path, 'rb') as f:
+            snapshot_key = marshal.load(f)
+        if snapshot_key == key:
+            data = np.load(snapshot_path, mmap_mode='r')
+            if shape is None or data.shape == shape:
+                return data
+            logger.warning(f"Snapshot {snapshot_path} has shape {data.shape} instead of {shape}, rebuilding it")
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable snapshot {snapshot_path}: {str(e)}")
+    
+    data = build()
+    try:
+        np.save(snapshot_path, data)
+        # Written last, so an interrupted save leaves no key for a partial array
+        with open(key_path, 'wb') as f:
+            marshal.dump(key, f)
+    except OSError as e:
+        logger.warning(f"Failed to write snapshot {snapshot_path}: {str(e)}")
+    return data
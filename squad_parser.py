@@ -1,148 +1,130 @@
 import os
+import sys
 import struct
+import binascii
+import io
 import logging
 import mmap
-from typing import Dict, List, Any, Optional, BinaryIO
+import pickle
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, BinaryIO, Sequence
+
+import numpy as np
+
+# Precompiled formats of the fields read from and written to squad files
+_U32_LE = struct.Struct('<I')
+# FC 25 file header: magic, version, file size
+_FILE_HEADER = struct.Struct('<4sII')
+# Section table entry: type, offset, size, padding
+_SECTION_ENTRY = struct.Struct('<IIII')
+# ID and name length at the start of team and country records
+_RECORD_HEADER = struct.Struct('<IB')
+# ID and data size at the start of player records
+_PLAYER_HEADER = struct.Struct('<II')
+
+# Maps every byte to itself if it is printable ASCII and to '.' otherwise, for hex dumps
+_PRINTABLE_TABLE = bytes(b if 32 <= b <= 126 else 0x2E for b in range(256))
+# Fixed-size tail of a country record: abbreviation, confederation, ISO code, level, rating, flag code
+_COUNTRY_FIELDS = struct.Struct('<3s8s6sBB3s')
+
+
+def _decode_name(raw) -> str:
+    """Decode a team or country name, written as UTF-8 but older files may use Latin-1"""
+    try:
+        return str(raw, 'utf-8')
+    except UnicodeDecodeError:
+        return str(raw, 'latin1')
+
+
+class _Country:
+    """A country record, its fields can also be read by index like the default database rows"""
+    __slots__ = ('name', 'short', 'abbrev', 'confed', 'iso', 'level', 'rating', 'flag')
+    
+    def __init__(self, name, short, abbrev, confed, iso, level, rating, flag):
+        self.name = sys.intern(name)
+        self.short = sys.intern(short)
+        self.abbrev = sys.intern(abbrev)
+        self.confed = sys.intern(confed)
+        self.iso = sys.intern(iso)
+        self.level = int(level)
+        self.rating = int(rating)
+        self.flag = sys.intern(flag)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(getattr(self, field) for field in self.__slots__[index])
+        return getattr(self, self.__slots__[index])
+    
+    def __len__(self):
+        return len(self.__slots__)
+    
+    def __eq__(self, other):
+        if not isinstance(other, _Country):
+            return NotImplemented
+        return self[:] == other[:]
+    
+    def __repr__(self):
+        return f"_Country{self[:]!r}"
+
+
+class _CacheUnpickler(pickle.Unpickler):
+    """Unpickler for squad caches, which only hold plain containers, strings, numbers and _Country records"""
+    
+    def find_class(self, module, name):
+        # Cache files sit next to squad files that may come from anywhere, refuse every other class
+        if module == __name__ and name == '_Country':
+            return _Country
+        raise pickle.UnpicklingError(f"Class {module}.{name} is not allowed in a squad cache")
+
 
 class SquadFile:
     # Magic numbers for different squad file versions
     MAGIC_NUMBERS = [b'FBCH', b'SQDF', b'SQDB', b'SQD2', b'SQIL']
     MAX_SECTION_COUNT = 100
     
+    # Parsed data is cached next to the squad file until the file changes
+    CACHE_SUFFIX = '.cache'
+    # Bumped whenever the layout of the cached data changes, older caches are then ignored
+    CACHE_VERSION = 4
+    CACHED_ATTRIBUTES = ['magic', 'version', 'countries', 'leagues', 'teams',
+                         'players', 'stadiums', 'tournaments', 'kits']
+    
+    # Methods handling each section type, by name so they can be looked up on the instance,
+    # and the attribute their parsed records are merged into
+    _SECTION_DISPATCH = {
+        0x01: ('_parse_teams_section', 'teams'),
+        0x02: ('_parse_players_section', 'players'),
+        0x03: ('_parse_leagues_section', 'leagues'),
+        0x04: ('_parse_countries_section', 'countries')  # Nations
+    }
+    # Sections parse into separate dicts, so several can be parsed at once
+    MAX_PARSE_WORKERS = 4
+    _FC25_SECTION_WRITERS = {
+        0x01: '_write_fc25_teams',
+        0x02: '_write_fc25_players',
+        0x03: '_write_fc25_leagues',
+        0x04: '_write_fc25_nations'
+    }
+    _LEGACY_SECTION_CONVERTERS = {
+        1: '_convert_countries_to_binary'
+    }
+    
     def __init__(self, file_path):
         self.file_path = file_path
-        self.countries: Dict[str, List[Any]] = {}
-        self.leagues: Dict[str, List[Any]] = {}
-        self.teams: Dict[str, List[Any]] = {}
-        self.players: Dict[str, List[Any]] = {}
-        self.stadiums: Dict[str, List[Any]] = {}
-        self.tournaments: Dict[str, List[Any]] = {}
-        self.kits: Dict[str, List[Any]] = {}
+        self.countries: Dict[int, Sequence[Any]] = {}
+        self.leagues: Dict[int, Sequence[Any]] = {}
+        self.teams: Dict[int, Sequence[Any]] = {}
+        self.players: Dict[int, Sequence[Any]] = {}
+        self.stadiums: Dict[int, Sequence[Any]] = {}
+        self.tournaments: Dict[int, Sequence[Any]] = {}
+        self.kits: Dict[int, Sequence[Any]] = {}
         self.version: Optional[int] = None
         self.magic: Optional[bytes] = None
         
-        # Setup logging
-        logging.basicConfig(
-            level=logging.DEBUG,
-            format='%(asctime)s - %(levelname)s - %(message)s'
-        )
+        # Logging is configured by the application
         self.logger = logging.getLogger(__name__)
     
-    def _read_bytes(self, f: BinaryIO, size: int) -> bytes:
-        """Read exact number of bytes"""
-        data = f.read(size)
-        if len(data) != size:
-            raise ValueError(f"Expected {size} bytes, got {len(data)}")
-        return data
-
-    def _read_uint32_bytes(self, f: BinaryIO) -> bytes:
-        """Read 4 bytes that represent a uint32"""
-        return self._read_bytes(f, 4)
-
-    def _bytes_to_uint32(self, data: bytes) -> int:
-        """Convert 4 bytes to uint32 safely"""
-        if len(data) != 4:
-            raise ValueError("Need exactly 4 bytes")
-        
-        # Try different methods to read the value
-        try:
-            # Method 1: struct.unpack
-            value = struct.unpack('<I', data)[0]
-            if value <= 0xFFFFFFFF:
-                return value
-        except:
-            pass
-        
-        try:
-            # Method 2: int.from_bytes
-            value = int.from_bytes(data, 'little', signed=False)
-            if value <= 0xFFFFFFFF:
-                return value
-        except:
-            pass
-        
-        try:
-            # Method 3: manual unpacking
-            value = data[0] | (data[1] << 8) | (data[2] << 16) | (data[3] << 24)
-            if value <= 0xFFFFFFFF:
-                return value
-        except:
-            pass
-        
-        # If all methods fail, try to handle overflow
-        try:
-            # Method 4: handle overflow by masking to 32 bits
-            value = (data[0] | (data[1] << 8) | (data[2] << 16) | (data[3] << 24)) & 0xFFFFFFFF
-            return value
-        except Exception as e:
-            self.logger.error(f"Failed to convert bytes to uint32: {data.hex()}")
-            raise ValueError(f"Invalid uint32 value: {data.hex()}")
-
-    def _validate_squad_file(self, file_path: str) -> bool:
-        """Validate squad file format and structure"""
-        try:
-            with open(file_path, 'rb') as f:
-                # Check file size
-                file_size = os.path.getsize(file_path)
-                if file_size < 12:
-                    self.logger.error("File too small to be a valid squad file")
-                    return False
-                
-                # Read and check magic number
-                magic = f.read(4)
-                if magic not in self.MAGIC_NUMBERS:
-                    self.logger.error(f"Invalid magic number: {magic!r}")
-                    return False
-                
-                # Read version
-                version_bytes = f.read(4)
-                try:
-                    version = struct.unpack('<I', version_bytes)[0]
-                    if not 0 <= version <= 1000:
-                        self.logger.warning(f"Unusual version number: {version}")
-                except struct.error:
-                    self.logger.error("Failed to read version number")
-                    return False
-                
-                # Read section count
-                section_count_bytes = f.read(4)
-                try:
-                    section_count = struct.unpack('<I', section_count_bytes)[0]
-                    if not 0 <= section_count <= self.MAX_SECTION_COUNT:
-                        self.logger.error(f"Invalid section count: {section_count}")
-                        return False
-                except struct.error:
-                    self.logger.error("Failed to read section count")
-                    return False
-                
-                # Try to read section table
-                try:
-                    for i in range(section_count):
-                        section_type = struct.unpack('<I', f.read(4))[0]
-                        section_offset = struct.unpack('<I', f.read(4))[0]
-                        section_size = struct.unpack('<I', f.read(4))[0]
-                        
-                        # Validate section bounds
-                        if section_offset + section_size > file_size:
-                            self.logger.error(f"Section {i} extends beyond file bounds")
-                            return False
-                        
-                        # Skip padding
-                        f.read(4)
-                except struct.error:
-                    self.logger.error(f"Failed to read section table entry {i}")
-                    return False
-                except Exception as e:
-                    self.logger.error(f"Error validating section table: {str(e)}")
-                    return False
-                
-                self.logger.info("Squad file validation successful")
-                return True
-                
-        except Exception as e:
-            self.logger.error(f"Error validating squad file: {str(e)}")
-            return False
-    
     def _dump_file_header(self, file_path: str) -> None:
         """Dump the first 64 bytes of the file for analysis"""
         try:
@@ -151,56 +133,84 @@ class SquadFile:
                 self.logger.info("File header dump:")
                 for i in range(0, len(header), 16):
                     chunk = header[i:i+16]
-                    hex_dump = ' '.join(f'{b:02x}' for b in chunk)
-                    ascii_dump = ''.join(chr(b) if 32 <= b <= 126 else '.' for b in chunk)
+                    hex_dump = binascii.hexlify(chunk, ' ').decode('ascii')
+                    ascii_dump = chunk.translate(_PRINTABLE_TABLE).decode('ascii')
                     self.logger.info(f"{i:04x}: {hex_dump:48} | {ascii_dump}")
         except Exception as e:
             self.logger.error(f"Failed to dump file header: {str(e)}")
 
-    def _read_uint32_safe(self, f: BinaryIO) -> int:
-        """Read an unsigned 32-bit integer safely"""
-        data = f.read(4)
-        if len(data) != 4:
-            raise ValueError(f"Expected 4 bytes for uint32, got {len(data)}")
+    def _write_uint32(self, f: BinaryIO, value: int) -> None:
+        """Write a little-endian unsigned 32-bit integer"""
+        f.write(_U32_LE.pack(value))
+
+    def _load_cache(self, key: tuple) -> bool:
+        """Load parsed data from the cache file if it was written for the given file key"""
+        cache_path = self.file_path + self.CACHE_SUFFIX
+        try:
+            with open(cache_path, 'rb') as f:
+                # The key is stored ahead of the data, so a stale cache is never unpickled
+                if _CacheUnpickler(f).load() != key:
+                    self.logger.info("Cache file is out of date")
+                    return False
+                cache = _CacheUnpickler(f).load()
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable cache file {cache_path}: {str(e)}")
+            return False
         
-        # Try different methods to read the value
-        methods = [
-            lambda: struct.unpack('<I', data)[0],  # Little-endian
-            lambda: struct.unpack('>I', data)[0],  # Big-endian
-            lambda: int.from_bytes(data, 'little'),  # Alternative little-endian
-            lambda: int.from_bytes(data, 'big'),  # Alternative big-endian
-            lambda: data[0] | (data[1] << 8) | (data[2] << 16) | (data[3] << 24),  # Manual little-endian
-            lambda: data[3] | (data[2] << 8) | (data[1] << 16) | (data[0] << 24)   # Manual big-endian
-        ]
+        if not isinstance(cache, dict) or not all(name in cache for name in self.CACHED_ATTRIBUTES):
+            self.logger.warning(f"Ignoring malformed cache file {cache_path}")
+            return False
         
-        errors = []
-        for method in methods:
-            try:
-                value = method()
-                if 0 <= value <= 0xFFFFFFFF:
-                    return value
-            except Exception as e:
-                errors.append(str(e))
+        for name in self.CACHED_ATTRIBUTES:
+            setattr(self, name, cache[name])
+        self.logger.info(f"Loaded squad data from cache: {cache_path}")
+        return True
+    
+    def _write_cache(self, key: tuple) -> None:
+        """Write the parsed data next to the squad file for the next load"""
+        cache_path = self.file_path + self.CACHE_SUFFIX
+        cache = {name: getattr(self, name) for name in self.CACHED_ATTRIBUTES}
+        try:
+            with open(cache_path, 'wb') as f:
+                pickle.dump(key, f, protocol=5)
+                pickle.dump(cache, f, protocol=5)
+        except OSError as e:
+            self.logger.warning(f"Failed to write cache file {cache_path}: {str(e)}")
+    
+    def validate(self) -> bool:
+        """Check the header and section table of the squad file without parsing the sections"""
+        try:
+            self.load(use_cache=False, parse_sections=False)
+        except Exception as e:
+            self.logger.error(f"Error validating squad file: {str(e)}")
+            return False
         
-        # If we get here, all methods failed
-        self.logger.error(f"Failed to read uint32 at offset 0x{f.tell()-4:08x}")
-        self.logger.error(f"Raw bytes: {' '.join(f'{b:02x}' for b in data)}")
-        self.logger.error(f"Errors: {', '.join(errors)}")
-        raise ValueError("Could not safely read uint32 value")
-
-    def load(self):
-        """Load data from squad file"""
-        if not os.path.exists(self.file_path):
+        self.logger.info("Squad file validation successful")
+        return True
+    
+    def load(self, use_cache: bool = True, parse_sections: bool = True):
+        """Load data from squad file, or only check its header and section table"""
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
             raise FileNotFoundError(f"Squad file not found: {self.file_path}")
         
-        file_size = os.path.getsize(self.file_path)
+        file_size = stat.st_size
         if file_size < 12:
             raise ValueError(f"File too small to be valid: {file_size} bytes")
         
-        with open(self.file_path, 'rb') as f:
+        # The cache is keyed by the file's modification time and size
+        cache_key = (stat.st_mtime_ns, file_size, self.CACHE_VERSION)
+        if use_cache and self._load_cache(cache_key):
+            return
+        
+        # The file is mapped rather than read, sections are sliced straight out of the mapping
+        with open(self.file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
             try:
                 # Read magic number
-                self.magic = self._read_bytes(f, 4)
+                self.magic = mm[0:4]
                 if self.magic not in self.MAGIC_NUMBERS:
                     self.logger.error(f"Invalid magic number: {self.magic!r}")
                     self.logger.error(f"Expected one of: {[m.decode('ascii', 'ignore') for m in self.MAGIC_NUMBERS]}")
@@ -209,121 +219,112 @@ class SquadFile:
                 self.logger.info(f"Detected file format: {self.magic.decode('ascii', 'ignore')}")
                 
                 # Read version
-                version_bytes = self._read_uint32_bytes(f)
-                try:
-                    self.version = self._bytes_to_uint32(version_bytes)
-                    if not 0 <= self.version <= 1000:
-                        self.logger.warning(f"Unusual version number: {self.version}")
-                except ValueError as e:
-                    self.logger.error(f"Invalid version number bytes: {version_bytes.hex()}")
-                    raise
+                self.version = _U32_LE.unpack_from(mm, 4)[0]
+                if not 0 <= self.version <= 1000:
+                    self.logger.warning(f"Unusual version number: {self.version}")
                 
                 # Read section count
-                section_count_bytes = self._read_uint32_bytes(f)
-                try:
-                    section_count = self._bytes_to_uint32(section_count_bytes)
-                    if not 0 <= section_count <= self.MAX_SECTION_COUNT:
-                        self.logger.error(f"Invalid section count: {section_count}")
-                        self.logger.error(f"Section count bytes: {section_count_bytes.hex()}")
-                        raise ValueError(f"Section count must be between 0 and {self.MAX_SECTION_COUNT}")
-                except ValueError as e:
-                    self.logger.error(f"Invalid section count bytes: {section_count_bytes.hex()}")
-                    raise
+                section_count = _U32_LE.unpack_from(mm, 8)[0]
+                if not 0 <= section_count <= self.MAX_SECTION_COUNT:
+                    self.logger.error(f"Invalid section count: {section_count}")
+                    self.logger.error(f"Section count bytes: {mm[8:12].hex()}")
+                    raise ValueError(f"Section count must be between 0 and {self.MAX_SECTION_COUNT}")
                 
                 self.logger.info(f"File version: {self.version}, sections: {section_count}")
                 
-                # Read section table
-                sections = []
-                for i in range(section_count):
-                    try:
-                        # Read section header
-                        type_bytes = self._read_uint32_bytes(f)
-                        offset_bytes = self._read_uint32_bytes(f)
-                        size_bytes = self._read_uint32_bytes(f)
-                        self._read_bytes(f, 4)  # Skip padding
-                        
-                        # Convert bytes to integers with validation
-                        try:
-                            section_type = self._bytes_to_uint32(type_bytes)
-                            section_offset = self._bytes_to_uint32(offset_bytes)
-                            section_size = self._bytes_to_uint32(size_bytes)
-                            
-                            # Validate section bounds
-                            if section_offset > file_size:
-                                raise ValueError(f"Section offset {section_offset} beyond file size {file_size}")
-                            if section_size > file_size - section_offset:
-                                raise ValueError(f"Section size {section_size} too large for offset {section_offset}")
-                            
-                            sections.append((section_type, section_offset, section_size))
-                            self.logger.info(f"Section {i}: type=0x{section_type:02x}, offset=0x{section_offset:08x}, size={section_size}")
-                            
-                        except ValueError as e:
-                            self.logger.error(f"Invalid section {i} header:")
-                            self.logger.error(f"  Type bytes: {type_bytes.hex()}")
-                            self.logger.error(f"  Offset bytes: {offset_bytes.hex()}")
-                            self.logger.error(f"  Size bytes: {size_bytes.hex()}")
-                            raise ValueError(f"Invalid section {i} header: {str(e)}")
-                            
-                    except Exception as e:
-                        self.logger.error(f"Error reading section {i} header: {str(e)}")
-                        raise
+                # Read the whole section table at once, one row of type, offset, size and padding per section
+                if 12 + section_count * _SECTION_ENTRY.size > file_size:
+                    raise ValueError(f"Section table extends beyond file size {file_size}")
+                table = np.frombuffer(mm, dtype='<u4', count=section_count * 4, offset=12)
+                table = table.reshape(section_count, 4).astype(np.int64)
+                types, offsets, sizes = table[:, 0], table[:, 1], table[:, 2]
+                
+                # Validate section bounds
+                invalid = np.flatnonzero((offsets > file_size) | (sizes > file_size - offsets))
+                if invalid.size:
+                    i = int(invalid[0])
+                    raise ValueError(f"Invalid section {i} header: offset {offsets[i]} and size {sizes[i]} "
+                                     f"do not fit in file size {file_size}")
                 
-                # Process sections
-                for i, (section_type, offset, size) in enumerate(sections):
+                sections = list(zip(types.tolist(), offsets.tolist(), sizes.tolist()))
+                self.logger.info(f"Read section table: {section_count} sections, {int(sizes.sum())} bytes of section data")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    for i, (section_type, section_offset, section_size) in enumerate(sections):
+                        self.logger.debug(f"Section {i}: type=0x{section_type:02x}, offset=0x{section_offset:08x}, size={section_size}")
+                
+                if not parse_sections:
+                    return
+                
+                # Process sections in parallel, then merge the results in file order on this thread.
+                # Parsers read the mapped pages through views, which must all be gone before it closes.
+                workers = max(1, min(self.MAX_PARSE_WORKERS, len(sections)))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [executor.submit(self._parse_section, section_type, memoryview(mm)[offset:offset+size])
+                               for section_type, offset, size in sections]
+                # The frames of every failed parser still hold its view of the mapping
+                for future in futures:
+                    error = future.exception()
+                    if error is not None:
+                        traceback.clear_frames(error.__traceback__)
+                for i, ((section_type, _, _), future) in enumerate(zip(sections, futures)):
                     try:
-                        f.seek(offset)
-                        
-                        # Read section data in chunks
-                        section_data = bytearray()
-                        remaining = size
-                        chunk_size = 1024 * 1024  # 1MB chunks
-                        
-                        while remaining > 0:
-                            to_read = min(remaining, chunk_size)
-                            chunk = self._read_bytes(f, to_read)
-                            section_data.extend(chunk)
-                            remaining -= to_read
-                        
-                        self._parse_section(section_type, bytes(section_data))
-                        
+                        records = future.result()
                     except Exception as e:
                         self.logger.error(f"Error processing section {i}: {str(e)}")
                         raise
+                    if records:
+                        getattr(self, self._SECTION_DISPATCH[section_type][1]).update(records)
                 
             except Exception as e:
                 self.logger.error(f"Error reading squad file: {str(e)}")
                 raise
+        
+        self._compact_rows()
+        
+        if use_cache:
+            self._write_cache(cache_key)
+    
+    def _compact_rows(self) -> None:
+        """Store every record as a tuple with its strings interned"""
+        # Countries are built as compact _Country records by their parser
+        for section in (self.leagues, self.teams, self.players,
+                        self.stadiums, self.tournaments, self.kits):
+            for key, row in section.items():
+                section[key] = self._compact_row(row)
+    
+    @staticmethod
+    def _compact_row(row: Sequence[Any]) -> tuple:
+        """Convert a record to a tuple, sharing one object per distinct string"""
+        return tuple(sys.intern(value) if isinstance(value, str) else value for value in row)
     
-    def _parse_section(self, section_type: int, data: bytes) -> None:
-        """Parse a section of the squad file"""
+    def _parse_section(self, section_type: int, data: bytes) -> Optional[Dict[int, Any]]:
+        """Parse a section of the squad file into its records by ID"""
         try:
             if len(data) == 0:
                 self.logger.warning(f"Empty section type 0x{section_type:02x}")
-                return
+                return None
             
-            self.logger.debug(f"Parsing section type 0x{section_type:02x} with {len(data)} bytes")
+            self.logger.debug("Parsing section type 0x%02x with %d bytes", section_type, len(data))
             
-            if section_type == 0x01:  # Teams
-                self._parse_teams_section(data)
-            elif section_type == 0x02:  # Players
-                self._parse_players_section(data)
-            elif section_type == 0x03:  # Leagues
-                self._parse_leagues_section(data)
-            elif section_type == 0x04:  # Nations
-                self._parse_countries_section(data)
-            else:
-                self.logger.warning(f"Unknown section type: 0x{section_type:02x}")
+            handler = self._SECTION_DISPATCH.get(section_type)
+            if handler is None:
+                self.logger.warning("Unknown section type: 0x%02x", section_type)
+                return None
+            return getattr(self, handler[0])(data)
         except Exception as e:
             self.logger.error(f"Error parsing section type 0x{section_type:02x}: {str(e)}")
             raise
     
-    def _parse_teams_section(self, data: bytes) -> None:
+    def _parse_teams_section(self, data: bytes) -> Dict[int, Any]:
         """Parse teams section data"""
+        teams = {}
+        # Checked once, so the per-team debug line costs nothing when it is disabled
+        debug = self.logger.isEnabledFor(logging.DEBUG)
         offset = 0
         while offset + 4 <= len(data):
             try:
                 # Read team ID
-                team_id = struct.unpack_from('<I', data, offset)[0]
+                team_id = _U32_LE.unpack_from(data, offset)[0]
                 offset += 4
                 
                 # Read name length
@@ -337,94 +338,107 @@ class SquadFile:
                     self.logger.error(f"Team name extends beyond section bounds")
                     break
                 
-                try:
-                    name = data[offset:offset+name_len].decode('utf-8')
-                except UnicodeDecodeError:
-                    name = data[offset:offset+name_len].decode('latin1')
-                
+                name = _decode_name(data[offset:offset+name_len])
                 offset += name_len
                 
                 # Store team data
-                self.teams[str(team_id)] = [name]
-                self.logger.debug(f"Parsed team: ID={team_id}, Name={name}")
+                teams[team_id] = [name]
+                if debug:
+                    self.logger.debug("Parsed team: ID=%d, Name=%s", team_id, name)
                 
             except Exception as e:
                 self.logger.error(f"Error parsing team at offset {offset}: {str(e)}")
                 break
+        
+        return teams
     
-    def _parse_players_section(self, data: bytes) -> None:
+    def _parse_players_section(self, data: bytes) -> Dict[int, Any]:
         """Parse players section data"""
+        players = {}
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        # Slices of the view share data, only small records are cheaper to copy than to view
+        view = memoryview(data)
         offset = 0
         while offset + 8 <= len(data):
             try:
                 # Read player ID and data size
-                player_id, data_size = struct.unpack_from('<II', data, offset)
+                player_id, data_size = _PLAYER_HEADER.unpack_from(view, offset)
                 offset += 8
                 
                 if offset + data_size > len(data):
                     self.logger.error(f"Player data extends beyond section bounds")
                     break
                 
-                # Process player data
-                player_data = self._process_player_data(data[offset:offset+data_size])
+                # Process player data. Large records are decoded from a view that is released
+                # right after, the decoded record must not keep a reference to it.
+                if data_size > 64:
+                    with view[offset:offset+data_size] as chunk:
+                        player_data = self._process_player_data(chunk)
+                else:
+                    player_data = self._process_player_data(bytes(data[offset:offset+data_size]))
                 if player_data:
-                    self.players[str(player_id)] = player_data
-                    self.logger.debug(f"Parsed player: ID={player_id}")
+                    players[player_id] = player_data
+                    if debug:
+                        self.logger.debug("Parsed player: ID=%d", player_id)
                 
                 offset += data_size
                 
             except Exception as e:
                 self.logger.error(f"Error parsing player at offset {offset}: {str(e)}")
                 break
+        
+        return players
     
-    def _parse_countries_section(self, data: bytes) -> None:
+    def _parse_countries_section(self, data: bytes) -> Dict[int, Any]:
         """Parse countries section data"""
+        countries = {}
+        # Latin-1 maps every byte to one character, so text offsets of the fixed fields match byte offsets
+        text = str(data, 'latin1')
         offset = 0
         while offset < len(data):
             try:
                 # Read country ID (4 bytes)
-                country_id = struct.unpack_from('<I', data, offset)[0]
+                country_id = _U32_LE.unpack_from(data, offset)[0]
                 offset += 4
                 
                 # Read name length and name
                 name_len = data[offset]
                 offset += 1
-                name = data[offset:offset+name_len].decode('latin1')
+                name = _decode_name(data[offset:offset+name_len])
                 offset += name_len
                 
                 # Read short name length and short name
                 short_name_len = data[offset]
                 offset += 1
-                short_name = data[offset:offset+short_name_len].decode('latin1')
+                short_name = _decode_name(data[offset:offset+short_name_len])
                 offset += short_name_len
                 
                 # Read fixed fields
-                abbrev = data[offset:offset+3].decode('latin1')
-                offset += 3
-                confederation = data[offset:offset+8].decode('latin1').rstrip('\x00')
-                offset += 8
-                iso_code = data[offset:offset+6].decode('latin1').rstrip('\x00')
-                offset += 6
-                level = data[offset]
-                offset += 1
-                rating = data[offset]
-                offset += 1
-                flag_code = data[offset:offset+3].decode('latin1')
-                offset += 3
+                if offset + _COUNTRY_FIELDS.size > len(data):
+                    raise ValueError("Country record extends beyond section bounds")
+                abbrev = text[offset:offset+3]
+                confederation = text[offset+3:offset+11].rstrip('\x00')
+                iso_code = text[offset+11:offset+17].rstrip('\x00')
+                level = data[offset+17]
+                rating = data[offset+18]
+                flag_code = text[offset+19:offset+22]
+                offset += _COUNTRY_FIELDS.size
                 
-                self.countries[str(country_id)] = [
+                countries[country_id] = _Country(
                     name, short_name, abbrev, confederation,
-                    iso_code, str(level), str(rating), flag_code
-                ]
+                    iso_code, level, rating, flag_code
+                )
                 
             except Exception as e:
                 self.logger.error(f"Error parsing country at offset {offset}: {str(e)}")
                 break
+        
+        return countries
     
-    def _parse_leagues_section(self, data: bytes) -> None:
+    def _parse_leagues_section(self, data: bytes) -> Dict[int, Any]:
         """Parse leagues section data"""
         # Similar structure to countries section
-        pass
+        return {}
     
     def save(self):
         """Save data to squad file"""
@@ -439,15 +453,6 @@ class SquadFile:
     
     def _save_fc25_format(self, f):
         """Save in FC 25 format"""
-        # Write header
-        f.write(b'FBCH')
-        self._write_uint32(f, self.version or 1)
-        
-        # Write file size and padding
-        size_pos = f.tell()
-        self._write_uint32(f, 0)  # Placeholder for file size
-        self._write_uint32(f, 0)  # Padding
-        
         # Count sections to write
         sections = [
             (0x01, self.teams),
@@ -457,50 +462,34 @@ class SquadFile:
         ]
         active_sections = [(type_id, data) for type_id, data in sections if data]
         
-        # Write section count
-        self._write_uint32(f, len(active_sections))
+        # Convert each section in memory first, so the whole layout is known before writing
+        blobs = []
+        for section_type, section_data in active_sections:
+            buf = io.BytesIO()
+            getattr(self, self._FC25_SECTION_WRITERS[section_type])(buf, section_data)
+            blobs.append((section_type, buf.getbuffer()))
         
-        # Write section table
-        section_table_pos = f.tell()
-        for section_type, _ in active_sections:
-            self._write_uint32(f, section_type)
-            self._write_uint32(f, 0)  # Placeholder for offset
-            self._write_uint32(f, 0)  # Placeholder for size
-            self._write_uint32(f, 0)  # Padding
+        # Sections follow the header, padding, section count and section table
+        section_offset = _FILE_HEADER.size + 2 * _U32_LE.size + len(blobs) * _SECTION_ENTRY.size
+        total_size = section_offset + sum(len(blob) for _, blob in blobs)
         
-        # Write each section
-        for i, (section_type, section_data) in enumerate(active_sections):
-            section_offset = f.tell()
-            section_start = f.tell()
-            
-            # Convert and write section data
-            if section_type == 0x01:
-                self._write_fc25_teams(f, section_data)
-            elif section_type == 0x02:
-                self._write_fc25_players(f, section_data)
-            elif section_type == 0x03:
-                self._write_fc25_leagues(f, section_data)
-            elif section_type == 0x04:
-                self._write_fc25_nations(f, section_data)
-            
-            section_size = f.tell() - section_start
-            
-            # Update section table
-            f.seek(section_table_pos + (i * 16) + 4)
-            self._write_uint32(f, section_offset)
-            self._write_uint32(f, section_size)
-            f.seek(0, 2)  # Seek to end
+        # Write header, padding and section count
+        f.write(_FILE_HEADER.pack(b'FBCH', self.version or 1, total_size))
+        self._write_uint32(f, 0)
+        self._write_uint32(f, len(blobs))
         
-        # Update file size
-        total_size = f.tell()
-        f.seek(size_pos)
-        self._write_uint32(f, total_size)
+        # Write section table, then the sections in the same order
+        for section_type, blob in blobs:
+            f.write(_SECTION_ENTRY.pack(section_type, section_offset, len(blob), 0))
+            section_offset += len(blob)
+        for _, blob in blobs:
+            f.write(blob)
     
     def _save_legacy_format(self, f):
         """Save in legacy format"""
         # Write file header
         f.write(self.magic or b'SQDF')
-        f.write(struct.pack('<I', self.version or 1))
+        self._write_uint32(f, self.version or 1)
         
         # Count sections
         sections = [
@@ -515,7 +504,7 @@ class SquadFile:
         active_sections = [(type_id, data) for type_id, data in sections if data]
         
         # Write section count
-        f.write(struct.pack('<I', len(active_sections)))
+        self._write_uint32(f, len(active_sections))
         
         # Write each section
         for section_type, section_data in active_sections:
@@ -524,12 +513,9 @@ class SquadFile:
     def _write_fc25_teams(self, f, teams):
         """Write teams in FC 25 format"""
         for team_id, data in teams.items():
-            # Write team ID
-            self._write_uint32(f, int(team_id))
-            
-            # Write name
+            # Write team ID and name
             name_bytes = data[0].encode('utf-8')
-            f.write(bytes([len(name_bytes)]))
+            f.write(_RECORD_HEADER.pack(team_id, len(name_bytes)))
             f.write(name_bytes)
     
     def _write_fc25_players(self, f, players):
@@ -554,8 +540,8 @@ class SquadFile:
             binary_data = self._convert_section_to_binary(section_type, data)
             
             # Write section header
-            f.write(struct.pack('<I', section_type))
-            f.write(struct.pack('<I', len(binary_data)))
+            self._write_uint32(f, section_type)
+            self._write_uint32(f, len(binary_data))
             
             # Write section data
             f.write(binary_data)
@@ -565,35 +551,46 @@ class SquadFile:
     
     def _convert_section_to_binary(self, section_type, data):
         """Convert section data to binary format"""
-        if section_type == 1:  # Countries
-            return self._convert_countries_to_binary(data)
-        # Add other section conversions as needed
-        return b''
+        converter_name = self._LEGACY_SECTION_CONVERTERS.get(section_type)
+        # Add other section conversions to _LEGACY_SECTION_CONVERTERS as needed
+        if converter_name is None:
+            return b''
+        return getattr(self, converter_name)(data)
     
     def _convert_countries_to_binary(self, countries):
         """Convert countries data to binary format"""
-        binary_data = bytearray()
+        # Encode the names first so the output can be allocated at its final size.
+        # Fields are read by index, new squads still hold the default database lists.
+        records = []
+        total_size = 0
         for country_id, data in countries.items():
-            # Write country ID
-            binary_data.extend(struct.pack('<I', int(country_id)))
-            
-            # Write name
-            name_bytes = data[0].encode('latin1')
-            binary_data.append(len(name_bytes))
-            binary_data.extend(name_bytes)
+            name_bytes = data[0].encode('utf-8')
+            short_name_bytes = data[1].encode('utf-8')
+            records.append((country_id, data, name_bytes, short_name_bytes))
+            total_size += _RECORD_HEADER.size + len(name_bytes) + 1 + len(short_name_bytes) + _COUNTRY_FIELDS.size
+        
+        binary_data = bytearray(total_size)
+        pos = 0
+        for country_id, data, name_bytes, short_name_bytes in records:
+            # Write country ID and name
+            _RECORD_HEADER.pack_into(binary_data, pos, country_id, len(name_bytes))
+            pos += _RECORD_HEADER.size
+            binary_data[pos:pos+len(name_bytes)] = name_bytes
+            pos += len(name_bytes)
             
             # Write short name
-            short_name_bytes = data[1].encode('latin1')
-            binary_data.append(len(short_name_bytes))
-            binary_data.extend(short_name_bytes)
+            binary_data[pos] = len(short_name_bytes)
+            pos += 1
+            binary_data[pos:pos+len(short_name_bytes)] = short_name_bytes
+            pos += len(short_name_bytes)
             
-            # Write fixed fields
-            binary_data.extend(data[2].encode('latin1'))  # Abbreviation (3 chars)
-            binary_data.extend(data[3].ljust(8, '\x00').encode('latin1'))  # Confederation
-            binary_data.extend(data[4].ljust(6, '\x00').encode('latin1'))  # ISO code
-            binary_data.append(int(data[5]))  # Level
-            binary_data.append(int(data[6]))  # Rating
-            binary_data.extend(data[7].encode('latin1'))  # Flag code (3 chars)
+            # Write fixed fields, the confederation and ISO code are padded with NULs
+            _COUNTRY_FIELDS.pack_into(
+                binary_data, pos,
+                data[2].encode('latin1'), data[3].encode('latin1'), data[4].encode('latin1'),
+                int(data[5]), int(data[6]), data[7].encode('latin1')
+            )
+            pos += _COUNTRY_FIELDS.size
             
         return binary_data
     
@@ -603,9 +600,8 @@ class SquadFile:
         return self.countries
     
     def update_country(self, country_id, data):
-        """Update country data"""
-        self.countries[country_id] = data
-        self.save()
+        """Update country data, written to disk by the next save()"""
+        self.countries[country_id] = _Country(*data)
     
     def get_leagues(self):
         """Get all leagues"""
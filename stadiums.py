@@ -1,14 +1,22 @@
-STADIUMS_DATABASE = {
-    # Format: "id": ["Name", "City", "Country", "Capacity", "Team", "Built Year", "Surface"]
-    "7": ["Old Trafford", "Manchester", "England", "74140", "Manchester United", "1910", "Grass"],
-    "8": ["Etihad Stadium", "Manchester", "England", "53400", "Manchester City", "2003", "Grass"],
-    "9": ["Santiago Bernabéu", "Madrid", "Spain", "81044", "Real Madrid", "1947", "Grass"],
-    "10": ["Spotify Camp Nou", "Barcelona", "Spain", "99354", "Barcelona", "1957", "Grass"],
-    "11": ["Allianz Arena", "Munich", "Germany", "75024", "Bayern Munich", "2005", "Grass"],
-    "12": ["Signal Iduna Park", "Dortmund", "Germany", "81365", "Borussia Dortmund", "1974", "Grass"],
-    "13": ["San Siro", "Milan", "Italy", "80018", "AC Milan/Inter", "1926", "Grass"],
-    "14": ["Parc des Princes", "Paris", "France", "47929", "Paris Saint-Germain", "1972", "Grass"],
-    "15": ["Anfield", "Liverpool", "England", "53394", "Liverpool", "1884", "Grass"],
-    "16": ["Emirates Stadium", "London", "England", "60704", "Arsenal", "2006", "Grass"],
-    # Add more stadiums...
-} 
\ No newline at end of file
+from .snapshot import load_snapshot
+
+
+def build_database():
+    """Build the default stadiums database"""
+    return {
+        # Format: id: ["Name", "City", "Country", "Capacity", "Team", "Built Year", "Surface"]
+        7: ["Old Trafford", "Manchester", "England", "74140", "Manchester United", "1910", "Grass"],
+        8: ["Etihad Stadium", "Manchester", "England", "53400", "Manchester City", "2003", "Grass"],
+        9: ["Santiago Bernabéu", "Madrid", "Spain", "81044", "Real Madrid", "1947", "Grass"],
+        10: ["Spotify Camp Nou", "Barcelona", "Spain", "99354", "Barcelona", "1957", "Grass"],
+        11: ["Allianz Arena", "Munich", "Germany", "75024", "Bayern Munich", "2005", "Grass"],
+        12: ["Signal Iduna Park", "Dortmund", "Germany", "81365", "Borussia Dortmund", "1974", "Grass"],
+        13: ["San Siro", "Milan", "Italy", "80018", "AC Milan/Inter", "1926", "Grass"],
+        14: ["Parc des Princes", "Paris", "France", "47929", "Paris Saint-Germain", "1972", "Grass"],
+        15: ["Anfield", "Liverpool", "England", "53394", "Liverpool", "1884", "Grass"],
+        16: ["Emirates Stadium", "London", "England", "60704", "Arsenal", "2006", "Grass"],
+        # Add more stadiums...
+    }
+
+
+STADIUMS_DATABASE = load_snapshot(__file__, build_database)
@@ -1,14 +1,22 @@
-TEAMS_DATABASE = {
-    # Format: "id": ["Name", "League", "Overall", "Attack", "Midfield", "Defense", "Home Stadium"]
-    "10": ["Manchester City", "Premier League", "87", "88", "86", "85", "Etihad Stadium"],
-    "11": ["Manchester United", "Premier League", "83", "82", "83", "82", "Old Trafford"],
-    "5": ["Real Madrid", "LaLiga EA Sports", "85", "84", "86", "84", "Santiago Bernabéu"],
-    "241": ["Barcelona", "LaLiga EA Sports", "84", "85", "84", "83", "Spotify Camp Nou"],
-    "73": ["Paris Saint-Germain", "Ligue 1 Uber Eats", "84", "87", "83", "82", "Parc des Princes"],
-    "21": ["Bayern Munich", "Bundesliga", "85", "86", "85", "84", "Allianz Arena"],
-    "244": ["Inter", "Serie A", "83", "83", "82", "83", "San Siro"],
-    "237": ["Benfica", "Primeira Liga", "81", "82", "81", "80", "Estádio da Luz"],
-    "245": ["Ajax", "Eredivisie", "77", "78", "77", "76", "Johan Cruyff Arena"],
-    "229": ["River Plate", "Liga Profesional", "78", "77", "78", "77", "El Monumental"],
-    # Add more teams...
-} 
\ No newline at end of file
+from .snapshot import load_snapshot
+
+
+def build_database():
+    """Build the default teams database"""
+    return {
+        # Format: id: ["Name", "League", "Overall", "Attack", "Midfield", "Defense", "Home Stadium"]
+        10: ["Manchester City", "Premier League", "87", "88", "86", "85", "Etihad Stadium"],
+        11: ["Manchester United", "Premier League", "83", "82", "83", "82", "Old Trafford"],
+        5: ["Real Madrid", "LaLiga EA Sports", "85", "84", "86", "84", "Santiago Bernabéu"],
+        241: ["Barcelona", "LaLiga EA Sports", "84", "85", "84", "83", "Spotify Camp Nou"],
+        73: ["Paris Saint-Germain", "Ligue 1 Uber Eats", "84", "87", "83", "82", "Parc des Princes"],
+        21: ["Bayern Munich", "Bundesliga", "85", "86", "85", "84", "Allianz Arena"],
+        244: ["Inter", "Serie A", "83", "83", "82", "83", "San Siro"],
+        237: ["Benfica", "Primeira Liga", "81", "82", "81", "80", "Estádio da Luz"],
+        245: ["Ajax", "Eredivisie", "77", "78", "77", "76", "Johan Cruyff Arena"],
+        229: ["River Plate", "Liga Profesional", "78", "77", "78", "77", "El Monumental"],
+        # Add more teams...
+    }
+
+
+TEAMS_DATABASE = load_snapshot(__file__, build_database)
@@ -1,14 +1,76 @@
-TOURNAMENTS_DATABASE = {
-    # Format: "id": ["Name", "Type", "Region", "Teams Count", "Prize Money", "Current Champion"]
-    "1": ["UEFA Champions League", "Club", "Europe", "32", "€20M", "Manchester City"],
-    "2": ["UEFA Europa League", "Club", "Europe", "32", "€8.5M", "Sevilla"],
-    "3": ["FIFA World Cup", "National", "World", "32", "€35M", "Argentina"],
-    "4": ["UEFA European Championship", "National", "Europe", "24", "€10M", "Italy"],
-    "5": ["Copa América", "National", "South America", "10", "€6.5M", "Argentina"],
-    "6": ["AFC Champions League", "Club", "Asia", "40", "€4M", "Urawa Red Diamonds"],
-    "7": ["CAF Champions League", "Club", "Africa", "16", "€2.5M", "Al Ahly"],
-    "8": ["Copa Libertadores", "Club", "South America", "47", "€18M", "Fluminense"],
-    "9": ["FA Cup", "Club", "England", "124", "£3.9M", "Manchester City"],
-    "10": ["FIFA Club World Cup", "Club", "World", "7", "€5M", "Manchester City"],
-    # Add more tournaments...
-} 
\ No newline at end of file
+import numpy as np
+
+from .snapshot import load_snapshot
+
+
+def build_database():
+    """Build the default tournaments database"""
+    return {
+        # Format: id: ["Name", "Type", "Region", "Teams Count", "Prize Money", "Current Champion"]
+        1: ["UEFA Champions League", "Club", "Europe", "32", "€20M", "Manchester City"],
+        2: ["UEFA Europa League", "Club", "Europe", "32", "€8.5M", "Sevilla"],
+        3: ["FIFA World Cup", "National", "World", "32", "€35M", "Argentina"],
+        4: ["UEFA European Championship", "National", "Europe", "24", "€10M", "Italy"],
+        5: ["Copa América", "National", "South America", "10", "€6.5M", "Argentina"],
+        6: ["AFC Champions League", "Club", "Asia", "40", "€4M", "Urawa Red Diamonds"],
+        7: ["CAF Champions League", "Club", "Africa", "16", "€2.5M", "Al Ahly"],
+        8: ["Copa Libertadores", "Club", "South America", "47", "€18M", "Fluminense"],
+        9: ["FA Cup", "Club", "England", "124", "£3.9M", "Manchester City"],
+        10: ["FIFA Club World Cup", "Club", "World", "7", "€5M", "Manchester City"],
+        # Add more tournaments...
+    }
+
+
+TOURNAMENTS_DATABASE = load_snapshot(__file__, build_database)
+
+
+# Multipliers of the suffixes used in prize money strings such as "€8.5M"
+_PRIZE_MULTIPLIERS = {"K": 1e3, "M": 1e6, "B": 1e9}
+
+
+def _parse_prize(prize):
+    """Split a prize money string into its currency symbol and amount"""
+    amount = prize[1:]
+    multiplier = _PRIZE_MULTIPLIERS.get(amount[-1:])
+    if multiplier is None:
+        return prize[0], float(amount)
+    return prize[0], float(amount[:-1]) * multiplier
+
+
+def _codes(values, categories):
+    """Encode values as int8 indexes into a tuple of categories"""
+    index = {category: code for code, category in enumerate(categories)}
+    return np.array([index[value] for value in values], dtype=np.int8)
+
+
+# Column arrays over the tournaments, index i of every column is the same tournament.
+# Regions and currencies are stored as codes indexing REGIONS and CURRENCIES.
+_rows = list(TOURNAMENTS_DATABASE.values())
+_prizes = [_parse_prize(row[4]) for row in _rows]
+REGIONS = tuple(dict.fromkeys(row[2] for row in _rows))
+CURRENCIES = tuple(dict.fromkeys(currency for currency, _ in _prizes))
+TOURNAMENTS = {
+    "id": np.array([int(tournament_id) for tournament_id in TOURNAMENTS_DATABASE], dtype=np.int32),
+    "name": [row[0] for row in _rows],
+    "is_club": np.array([row[1] == "Club" for row in _rows], dtype=np.bool_),
+    "region": _codes((row[2] for row in _rows), REGIONS),
+    "teams": np.array([int(row[3]) for row in _rows], dtype=np.int16),
+    "prize_amount": np.array([amount for _, amount in _prizes], dtype=np.float32),
+    "prize_currency": _codes((currency for currency, _ in _prizes), CURRENCIES),
+    "champion": [row[5] for row in _rows]
+}
+del _rows, _prizes
+
+
+def get_tournament(i):
+    """Get the tournament at column index i with its fields by name"""
+    return {
+        "id": int(TOURNAMENTS["id"][i]),
+        "name": TOURNAMENTS["name"][i],
+        "type": "Club" if TOURNAMENTS["is_club"][i] else "National",
+        "region": REGIONS[TOURNAMENTS["region"][i]],
+        "teams": int(TOURNAMENTS["teams"][i]),
+        "prize_amount": float(TOURNAMENTS["prize_amount"][i]),
+        "prize_currency": CURRENCIES[TOURNAMENTS["prize_currency"][i]],
+        "champion": TOURNAMENTS["champion"][i]
+    }